@@ -13,6 +13,7 @@ __email__ = __email__
 
 # Imports #
 # Standard Libraries #
+import math
 from typing import Any
 
 # Third-Party Packages #
@@ -26,6 +27,43 @@ from ..basedatasetcomponent import BaseDatasetComponent
 
 
 # Definitions #
+# Functions #
+def find_sorted_index(
+    data: np.ndarray,
+    item: int | float,
+    side: str = "left",
+    approx: bool = False,
+    tails: bool = False,
+) -> int | None:
+    """Finds the insertion index of an item within a sorted axis using a binary search.
+
+    Args:
+        data: The sorted axis to search.
+        item: The item to find within the axis.
+        side: The side of equal values to return the index of, either "left" or "right".
+        approx: Determines if an approximate index will be given if the value is not present.
+        tails: Determines if the first or last index will be give the requested item is outside the axis.
+
+    Returns:
+        The insertion index of the item or None if it could not be found.
+    """
+    if item < data[0]:
+        return 0 if tails else None
+    elif item > data[-1]:
+        return data.shape[0] if tails else None
+
+    key = item
+    if data.dtype.kind in "iu" and not isinstance(item, (int, np.integer)):
+        # Rounding toward the searched side gives the same index without promoting the whole axis to float.
+        key = data.dtype.type(math.ceil(item) if side == "left" else math.floor(item))
+
+    index = int(np.searchsorted(data, key, side=side))
+    if approx or data[index if side == "left" else index - 1] == item:
+        return index
+    else:
+        return None
+
+
 # Classes #
 class AxisComponent(BaseDatasetComponent):
     """A component for a HDF5Dataset which gives axis (scale) functionality.
@@ -201,19 +239,13 @@ class AxisComponent(BaseDatasetComponent):
         Returns:
             The requested closest index and the value at that index.
         """
-        samples = self.composite.shape[0]
-        if item < self.composite.start:
-            if tails:
-                return IndexValue(0, self.start)
-        elif item > self.end:
-            if tails:
-                return IndexValue(samples - 1, self.end)
+        data = self.composite.all_data
+        index = find_sorted_index(data, item, side="right", approx=approx, tails=tails)
+        if index is None:
+            return IndexValue(None, None)
         else:
-            item = int(np.searchsorted(self.composite.all_data, item, side="right") - 1)
-            if approx or item == self.composite.all_data[item]:
-                return IndexValue(item, self.composite.all_data[item])
-            else:
-                return IndexValue(None, None)
+            index = max(index - 1, 0)
+            return IndexValue(index, data[index])
 
     def find_range(
         self,
@@ -235,23 +267,26 @@ class AxisComponent(BaseDatasetComponent):
         Returns:
             The data range on the axis and the start and stop indices.
         """
+        all_data = self.composite.all_data
+
+        # The axis is monotonic, so the bounds are found by binary search rather than by scanning.
         if start is None:
             start_index = 0
         else:
-            start_index, _ = self.find_index(item=start, approx=approx, tails=tails)
+            start_index = find_sorted_index(all_data, start, side="left", approx=approx, tails=tails)
 
         if stop is None:
-            stop_index = self.composite.shape[0] - 1
+            stop_index = all_data.shape[0]
         else:
-            stop_index, _ = self.find_index(item=stop, approx=approx, tails=tails)
+            stop_index = find_sorted_index(all_data, stop, side="right", approx=approx, tails=tails)
 
         if start_index is None and stop_index is None:
             return FoundRange(None, None, None)
         else:
-            data = self.composite.all_data[slice(start=start_index, stop=stop_index, step=step)]
+            data = all_data[start_index:stop_index:step]
 
             if step is not None and step != 1:
-                stop_index = int(data.shape[0] * step + start_index)
+                stop_index = int(data.shape[0] * step + (start_index or 0))
 
             return FoundRange(data, start_index, stop_index)
 
@@ -271,8 +306,13 @@ class AxisComponent(BaseDatasetComponent):
             stop: The last value to shift.
             step: The interval to apply the shift across the range.
         """
-        with self:
-            self.composite[start:stop:step] += shift
+        selection = slice(start, stop, step)
+        with self.composite:
+            dataset = self.composite._dataset
+            data = dataset[selection]
+            data += shift
+            dataset[selection] = data
+        self.composite.clear_all_caches()
         self.refresh()
 
 
@@ -21,9 +21,12 @@ from typing import Any
 import zoneinfo
 
 # Third-Party Packages #
+from baseobjects import search_sentinel
 from baseobjects.functions import singlekwargdispatch
 from baseobjects.cachingtools import timed_keyless_cache
 from baseobjects.operations import timezone_offset
+from dspobjects.dataclasses import IndexDateTime
+from dspobjects.time import Timestamp, nanostamp
 from proxyarrays import ContainerTimeAxis
 import h5py
 import numpy as np
@@ -34,6 +37,52 @@ from .axiscomponent import AxisMap, AxisComponent
 
 
 # Definitions #
+_ITERABLE_TYPES = {list, tuple}
+
+
+# Functions #
+def to_nanostamps(
+    value: datetime.datetime | datetime.timedelta | float | int | Iterable | np.ndarray,
+) -> np.int64 | np.ndarray:
+    """Converts datetimes, timedeltas, or timestamps in seconds to int64 nanoseconds in one pass.
+
+    The units match nanostamp: numbers are timestamps in seconds, except uint64 values, which are already nanostamps.
+    Converting once up front keeps later comparisons against the time axis in a single integer dtype.
+
+    Args:
+        value: The time or times to convert.
+
+    Returns:
+        The time or times as int64 nanoseconds.
+    """
+    if isinstance(value, np.ndarray):
+        kind = value.dtype.kind
+        if value.dtype == np.uint64:
+            return value.astype(np.int64)
+        elif kind in "iu":
+            return value.astype(np.int64) * 10**9
+        elif kind == "f":
+            return np.rint(value * 1e9).astype(np.int64)
+        elif kind == "M":
+            return value.astype("datetime64[ns]").view(np.int64)
+        elif kind == "m":
+            return value.astype("timedelta64[ns]").view(np.int64)
+        else:
+            return np.fromiter((to_nanostamps(v) for v in value.flat), dtype=np.int64, count=value.size)
+    elif isinstance(value, datetime.datetime):
+        return np.int64(round(value.timestamp() * 1e6) * 1000)
+    elif isinstance(value, datetime.timedelta):
+        return np.int64((value // datetime.timedelta(microseconds=1)) * 1000)
+    elif isinstance(value, np.uint64):
+        return np.int64(value)
+    elif isinstance(value, (int, np.integer)):
+        return np.int64(int(value) * 10**9)
+    elif isinstance(value, Iterable):
+        return np.fromiter((to_nanostamps(v) for v in value), dtype=np.int64)
+    else:
+        return np.int64(round(value * 1e9))
+
+
 # Classes #
 class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
     """A component for a HDF5Dataset which defines it as an axis that represents time.
@@ -45,6 +94,8 @@ class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
     Attributes:
         default_kwargs: The default keyword arguments to use when creating the dataset.
         _scale_name: The scale name of this axis.
+        _time_zone_mask: A time zone to use instead of the one in the file.
+        _sample_rate_attribute: The cached sample rate from the file.
 
     Args:
         start: The start of the axis.
@@ -75,6 +126,7 @@ class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
     ) -> None:
         # New Attributes #
         self._time_zone_mask: datetime.tzinfo | None = None
+        self._sample_rate_attribute: Decimal | None | Any = search_sentinel
 
         # Parent Attributes #
         super().__init__(init=False)
@@ -132,25 +184,34 @@ class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
     @property
     def nanostamps(self) -> np.ndarray | None:
         """The nanosecond timestamps of this proxy."""
-        return self.get_nanostamps()
+        try:
+            return self.get_nanostamps.caching_call()
+        except AttributeError:
+            return self.get_nanostamps()
 
     @property
     def timestamps(self) -> np.ndarray | None:
         """The timestamps of this proxy."""
-        return self.get_timestamps()
+        try:
+            return self.get_timestamps.caching_call()
+        except AttributeError:
+            return self.get_timestamps()
 
     @property
     def _sample_rate(self) -> Decimal | None:
         """The sample rate of this timeseries."""
-        try:
-            return Decimal(self.composite.attributes["sample_rate"])
-        except TypeError:
-            return None
+        if self._sample_rate_attribute is search_sentinel:
+            try:
+                self._sample_rate_attribute = Decimal(self.composite.attributes.get_attribute("sample_rate"))
+            except TypeError:
+                self._sample_rate_attribute = None
+        return self._sample_rate_attribute
 
     @_sample_rate.setter
     def _sample_rate(self, value: Decimal) -> None:
         if self.composite is not None:
             self.composite.attributes.set_attribute("sample_rate", float(value))
+            self._sample_rate_attribute = search_sentinel
 
     @property
     def time_zone(self) -> zoneinfo.ZoneInfo | None:
@@ -180,10 +241,7 @@ class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
     @property
     def datetimes(self) -> tuple[datetime.datetime]:
         """Returns all the data for this object as datetime objects."""
-        try:
-            return self.get_datetimes.caching_call()
-        except AttributeError:
-            return self.get_datetimes()
+        return self.get_datetimes.caching_call()
 
     @property
     def _data(self) -> Any:
@@ -273,18 +331,40 @@ class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
         else:
             self.set_data(data=np.arange(start, stop, step), **d_kwargs)
 
-    @singlekwargdispatch("datetimes")
     def from_datetimes(self, datetimes: Iterable[datetime.datetime | float] | np.ndarray, **kwargs: Any) -> None:
         """Sets the axis values to a series of datetimes.
 
+        The common concrete types are checked directly, so the dispatcher's ABC instance checks are only used for
+        other types.
+
+        Args:
+            datetimes: The datetimes of the axis.
+            **kwargs: The keyword arguments for the HDF5Dataset.
+        """
+        type_ = type(datetimes)
+        if type_ is np.ndarray:
+            self.from_timestamps(datetimes=datetimes, **kwargs)
+        elif type_ in _ITERABLE_TYPES:
+            self.from_datetime_iterable(datetimes=datetimes, **kwargs)
+        else:
+            self.dispatch_from_datetimes(datetimes=datetimes, **kwargs)
+
+    @singlekwargdispatch("datetimes")
+    def dispatch_from_datetimes(
+        self,
+        datetimes: Iterable[datetime.datetime | float] | np.ndarray,
+        **kwargs: Any,
+    ) -> None:
+        """Sets the axis values to a series of datetimes by dispatching on the type of the datetimes.
+
         Args:
             datetimes: The datetimes of the axis.
             **kwargs: The keyword arguments for the HDF5Dataset.
         """
         raise TypeError(f"A {type(datetimes)} cannot be used to construct the time axis.")
 
-    @from_datetimes.register(Iterable)
-    def _(self, datetimes: Iterable[datetime.datetime | float], **kwargs: Any) -> None:
+    @dispatch_from_datetimes.register(Iterable)
+    def from_datetime_iterable(self, datetimes: Iterable[datetime.datetime | float], **kwargs: Any) -> None:
         """Sets the axis values to a series of datetimes.
 
         Args:
@@ -303,8 +383,8 @@ class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
                 stamps[index] = dt
         self.set_data(data=stamps, **d_kwargs)
 
-    @from_datetimes.register
-    def _(self, datetimes: np.ndarray, **kwargs: Any) -> None:
+    @dispatch_from_datetimes.register
+    def from_timestamps(self, datetimes: np.ndarray, **kwargs: Any) -> None:
         """Sets the axis values to a series of timestamps.
 
         Args:
@@ -319,7 +399,10 @@ class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
     def refresh(self) -> None:
         """Reloads the time axis and attributes."""
         super().refresh()
+        self.get_nanostamps.clear_cache()
+        self.get_timestamps.clear_cache()
         self.get_datetimes.clear_cache()
+        self._sample_rate_attribute = search_sentinel
 
     # Getters/Setter
     def get_all_data(self) -> np.ndarray:
@@ -330,6 +413,42 @@ class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
         """
         return self.composite[...]
 
+    @timed_keyless_cache(lifetime=1.0, call_method="clearing_call", local=True)
+    def get_nanostamps(self) -> np.ndarray | None:
+        """Gets the nanostamps of this axis as one contiguous array, using caching.
+
+        Returns:
+            The nanostamps of this axis.
+        """
+        data = self.composite.all_data
+        if self.get_original_precision():
+            return data
+        else:
+            return (data * 10**9).astype(np.uint64)
+
+    @timed_keyless_cache(lifetime=1.0, call_method="clearing_call", local=True)
+    def get_timestamps(self) -> np.ndarray | None:
+        """Gets the timestamps of this axis as one contiguous array, using caching.
+
+        Returns:
+            The timestamps of this axis.
+        """
+        data = self.composite.all_data
+        if self.get_original_precision():
+            return data / 10**9
+        else:
+            return data
+
+    @timed_keyless_cache(lifetime=1.0, call_method="clearing_call", local=True)
+    def get_datetimes(self) -> tuple[datetime.datetime, ...]:
+        """Gets the datetimes of this axis in its time zone, using caching.
+
+        Returns:
+            The datetimes of this axis.
+        """
+        tz = datetime.timezone.utc if self.tzinfo is None else self.tzinfo
+        return tuple(Timestamp.fromnanostamp(ns, tz=tz) for ns in self.get_nanostamps())
+
     def get_original_precision(self) -> bool:
         """Gets the presision of the timestamps from the orignial file.
 
@@ -399,6 +518,191 @@ class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
         self.composite.attributes["time_zone"] = value
         self.composite.attributes["time_zone_offset"] = offset
 
+    # Find
+    def find_time_index(
+        self,
+        timestamp: datetime.datetime | float | int | np.dtype,
+        approx: bool = True,
+        tails: bool = False,
+    ) -> IndexDateTime:
+        """Finds the index with given time, can give approximate values.
+
+        The nanostamps are fetched once and searched with a single binary search in their own dtype.
+
+        Args:
+            timestamp: The timestamp to find the index for.
+            approx: Determines if an approximate index will be given if the time is not present.
+            tails: Determines if the first or last index will be give the requested time is outside the axis.
+
+        Returns:
+            The requested closest index and the value at that index.
+        """
+        nanostamps = self.nanostamps
+        nano_ts = nanostamp(timestamp)
+
+        if nano_ts < nanostamps[0]:
+            if tails:
+                return IndexDateTime(0, self.start_datetime)
+        elif nano_ts > nanostamps[-1]:
+            if tails:
+                return IndexDateTime(nanostamps.shape[0], self.end_datetime)
+        else:
+            index = int(np.searchsorted(nanostamps, nanostamps.dtype.type(nano_ts), side="right")) - 1
+            true_nanostamp = nanostamps[index]
+            if approx or nano_ts == true_nanostamp:
+                tz = datetime.timezone.utc if self.tzinfo is None else self.tzinfo
+                return IndexDateTime(index, Timestamp.fromnanostamp(true_nanostamp, tz=tz))
+
+        raise IndexError("Timestamp out of range.")
+
+    def find_time_indices(
+        self,
+        timestamps: Iterable[datetime.datetime | float] | np.ndarray,
+        approx: bool = True,
+        tails: bool = False,
+    ) -> np.ndarray:
+        """Finds the indices of many times at once with one vectorized binary search, can give approximate values.
+
+        Args:
+            timestamps: The timestamps to find the indices for.
+            approx: Determines if approximate indices will be given if the times are not present.
+            tails: Determines if the first or last index will be give the requested time is outside the axis.
+
+        Returns:
+            The index of each time or the closest index before it.
+        """
+        nanostamps = self.nanostamps
+        if isinstance(timestamps, np.ndarray):
+            nano_ts = nanostamp(timestamps)
+        else:
+            nano_ts = np.array([nanostamp(t) for t in timestamps])
+        nano_ts = nano_ts.astype(nanostamps.dtype, copy=False)
+
+        indices = np.searchsorted(nanostamps, nano_ts, side="right") - 1
+        below = nano_ts < nanostamps[0]
+        above = nano_ts > nanostamps[-1]
+        if tails:
+            indices[below] = 0
+            indices[above] = nanostamps.shape[0]
+        elif below.any() or above.any():
+            raise IndexError("Timestamp out of range.")
+
+        if not approx:
+            inside = ~(below | above)
+            if not np.array_equal(nanostamps[indices[inside]], nano_ts[inside]):
+                raise IndexError("Timestamp out of range.")
+
+        return indices
+
+    def find_time_index_slice(
+        self,
+        start: datetime.datetime | float | int | np.dtype | None = None,
+        stop: datetime.datetime | float | int | np.dtype | None = None,
+        step: int | float | datetime.timedelta | None = None,
+        approx: bool = True,
+        tails: bool = False,
+    ) -> tuple[IndexDateTime, IndexDateTime, int | float | datetime.timedelta | None]:
+        """Finds the indices for a slice inbetween two times, can give approximate values.
+
+        The nanostamps are fetched once for both ends of the slice and searched in their own dtype.
+
+        Args:
+            start: The first time to find for the slice.
+            stop: The last time to find for the slice.
+            step: The step between elements in the slice.
+            approx: Determines if an approximate indices will be given if the time is not present.
+            tails: Determines if the first or last times will be give the requested item is outside the axis.
+
+        Returns:
+            The slice indices.
+        """
+        nanostamps = self.nanostamps
+        samples = nanostamps.shape[0]
+        type_ = nanostamps.dtype.type
+        tz = datetime.timezone.utc if self.tzinfo is None else self.tzinfo
+
+        if start is None:
+            start_index = IndexDateTime(0, self.start_datetime)
+        else:
+            start_ns = nanostamp(start)
+            start_index = None
+            if start_ns < nanostamps[0]:
+                if tails:
+                    start_index = IndexDateTime(0, self.start_datetime)
+            elif start_ns > nanostamps[-1]:
+                if tails:
+                    start_index = IndexDateTime(samples, self.end_datetime)
+            else:
+                index = int(np.searchsorted(nanostamps, type_(start_ns), side="right")) - 1
+                true_nanostamp = nanostamps[index]
+                if approx or start_ns == true_nanostamp:
+                    start_index = IndexDateTime(index, Timestamp.fromnanostamp(true_nanostamp, tz=tz))
+
+        if stop is None:
+            stop_index = IndexDateTime(samples, self.end_datetime)
+        else:
+            stop_ns = nanostamp(stop)
+            stop_index = None
+            if stop_ns < nanostamps[0]:
+                if tails:
+                    stop_index = IndexDateTime(0, self.start_datetime)
+            elif stop_ns > nanostamps[-1]:
+                if tails:
+                    stop_index = IndexDateTime(samples, self.end_datetime)
+            else:
+                index = int(np.searchsorted(nanostamps, type_(stop_ns), side="left"))
+                true_nanostamp = nanostamps[index - 1 if index != 0 else 0]
+                if approx or stop_ns == true_nanostamp:
+                    stop_index = IndexDateTime(index, Timestamp.fromnanostamp(true_nanostamp, tz=tz))
+
+        if start_index is None:
+            raise IndexError("Start out of range.")
+        if stop_index is None:
+            raise IndexError("Stop out of range.")
+
+        return start_index, stop_index, step
+
+    # Manipulation
+    def shift(
+        self,
+        shift: int | float | datetime.timedelta,
+        start: int | None = None,
+        stop: int | None = None,
+        step: int | None = None,
+    ) -> None:
+        """Shifts times over a range in the axis.
+
+        Args:
+            shift: The time to shift the times by, in the units of the axis if not a timedelta.
+            start: The first time to shift.
+            stop: The last time to shift.
+            step: The interval to apply the shift across the range.
+        """
+        if isinstance(shift, datetime.timedelta):
+            if self.get_original_precision():
+                # The shift is cast to the axis dtype, where negative shifts wrap around and still subtract.
+                shift = to_nanostamps(shift).astype(np.uint64)
+            else:
+                shift = shift.total_seconds()
+        super().shift(shift=shift, start=start, stop=stop, step=step)
+
+    def shift_times(
+        self,
+        shift: np.ndarray | float | int | datetime.timedelta,
+        start: int | None = None,
+        stop: int | None = None,
+        step: int | None = None,
+    ) -> None:
+        """Shifts times by a certain amount.
+
+        Args:
+            shift: The amount to shift the times by.
+            start: The first time point to shift.
+            stop: The stop time point to shift.
+            step: The interval of the time points to shift.
+        """
+        self.shift(shift=shift, start=start, stop=stop, step=step)
+
     # Masking
     def mask_time_zone(self, tz: datetime.tzinfo | None) -> None:
         """Masks the time zone of this another timezone.
@@ -407,7 +711,7 @@ class TimeAxisComponent(AxisComponent, ContainerTimeAxis):
             tz: The time zone to use instead or None to use the original time zone.
         """
         self._time_zone_mask = tz
-        self.get_datetimes.cache_clear()
+        self.get_datetimes.clear_cache()
 
     # Data
     def create_component(self) -> None:
@@ -13,18 +13,23 @@ __email__ = __email__
 
 # Imports #
 # Standard Libraries #
-from collections.abc import Iterable
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
 import datetime
 from decimal import Decimal
 from typing import Any
 
 # Third-Party Packages #
+from baseobjects import search_sentinel
+from baseobjects.cachingtools import timed_lru_cache
+from dspobjects.dataclasses import FoundRange
 from proxyarrays import ContainerTimeSeries
 import h5py
 import numpy as np
 
 # Local Packages #
 from ...hdf5bases import HDF5Dataset
+from ..axes.timeaxiscomponent import to_nanostamps
 from ..basedatasetcomponent import BaseDatasetComponent
 
 
@@ -33,10 +38,15 @@ from ..basedatasetcomponent import BaseDatasetComponent
 class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
     """A component for a HDF5Dataset which gives it time series functionality.
 
+    Class Attributes:
+        default_block_length: The number of samples in a block when the data is not chunked.
+
     Attributes:
         _sample_rate_: The temporary sample rate of this time series.
         _time_axis: The time axis object of this time series.
         _t_axis: The dim number of the time axis.
+        _t_axis_attribute: The cached dim number of the time axis from the file.
+        _layout: The time axis, the selection before the time axis, and the block length for the current layout.
         scale_name: The scale name of the time axis.
 
     Args:
@@ -50,6 +60,8 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
         **kwargs: Keyword arguments for inheritance.
     """
 
+    default_block_length: int = 4096
+
     # Magic Methods #
     # Construction/Destruction
     def __init__(
@@ -68,6 +80,8 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
         self._time_axis: HDF5Dataset | None = None
 
         self._t_axis: int | None = None
+        self._t_axis_attribute: int | Any = search_sentinel
+        self._layout: tuple[int, tuple[slice, ...], int] | None = None
         self.scale_name: str = "time_axis"
 
         # Parent Attributes #
@@ -157,6 +171,23 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
 
         super().construct(composite=composite, precise=precise, tzinfo=tzinfo, **kwargs)
 
+    # File
+    @contextmanager
+    def pinned(self) -> Generator["TimeSeriesComponent", None, None]:
+        """Keeps the file open for a batch of reads, so each read does not reopen and check the file.
+
+        Yields:
+            This object.
+        """
+        with self.composite:
+            yield self
+
+    def refresh(self) -> None:
+        """Clears the attribute values cached by this component so they are read from the file again."""
+        self._t_axis_attribute = search_sentinel
+        self._layout = None
+
+    # Getters/Setters
     def get_t_axis(self) -> int:
         """Gets the dim number of the time axis.
 
@@ -165,8 +196,10 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
         """
         if self._t_axis is not None:
             return self._t_axis
-        else:
-            return self.composite.attributes["t_axis"]
+
+        if self._t_axis_attribute is search_sentinel:
+            self._t_axis_attribute = self.composite.attributes.get_attribute("t_axis")
+        return self._t_axis_attribute
 
     def set_t_axis_local(self, value: int | None) -> None:
         """Sets the t axis to a value, but does not update the attribute in the file.
@@ -183,6 +216,7 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
             value: The dim number of the time axis.
         """
         self.composite.attributes.set_attribute("t_axis", value)
+        self._t_axis_attribute = value
         self._t_axis = None
 
     def set_time_axis(self, t_axis: int | None = None, scale_name: str | None = None) -> None:
@@ -200,6 +234,186 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
 
         self._time_axis = self.composite.axes[self.t_axis][self.scale_name]
 
+    def get_layout(self) -> tuple[int, tuple[slice, ...], int]:
+        """Gets the layout of the data, which is only evaluated again when the time axis changes.
+
+        Returns:
+            The time axis, the selection of the dims before the time axis, and the block length.
+        """
+        t_axis = self.t_axis
+        layout = self._layout
+        if layout is None or layout[0] != t_axis:
+            chunks = self.composite.chunks
+            length = self.default_block_length if chunks is None else chunks[t_axis]
+            self._layout = layout = (t_axis, (slice(None),) * t_axis, length)
+        return layout
+
+    def get_block_length(self) -> int:
+        """Gets the number of samples along the time axis in a block, which follows the chunking of the data.
+
+        Returns:
+            The number of samples in a block.
+        """
+        return self.get_layout()[2]
+
+    @timed_lru_cache(maxsize=32, lifetime=1.0, call_method="clearing_call", local=True)
+    def get_block(self, index: int) -> np.ndarray:
+        """Gets a chunk aligned block of data along the time axis, using caching.
+
+        Args:
+            index: The index of the block.
+
+        Returns:
+            The data within the block.
+        """
+        t_axis, prefix, length = self.get_layout()
+        shape = list(self.composite.shape)
+        start = min(index * length, shape[t_axis])
+        stop = min(start + length, shape[t_axis])
+        shape[t_axis] = stop - start
+        selection = prefix + (slice(start, stop),)
+
+        if self.composite.file.swmr_mode or stop == start:
+            return self.composite[selection]
+
+        # Reading directly into a new array skips the selection and allocation work of h5py's getitem.
+        with self.composite:
+            dataset = self.composite._dataset
+            data = np.empty(shape, dtype=dataset.dtype)
+            dataset.read_direct(data, source_sel=selection)
+        return data
+
+    def get_block_range(self, start: int | None = None, stop: int | None = None, step: int | None = None) -> np.ndarray:
+        """Gets a range of data along the time axis from the cached chunk aligned blocks.
+
+        Repeated small reads which fall within the same chunks only read those chunks from the file once.
+
+        Args:
+            start: The first sample of the range.
+            stop: The stop sample of the range.
+            step: The interval between samples in the range.
+
+        Returns:
+            The data within the range.
+        """
+        t_axis, prefix, length = self.get_layout()
+        start, stop, step = slice(start, stop, step).indices(self.composite.shape[t_axis])
+        indices = range(start, stop, step)
+        if not indices:
+            return self.composite[prefix + (slice(start, start),)]
+        elif step < 0:  # HDF5 cannot select backwards, so the samples are selected forwards and reversed.
+            return self.get_block_range(indices[-1], indices[0] + 1)[prefix + (slice(None, None, step),)]
+
+        first = start // length
+        blocks = []
+        for index in range(first, (stop - 1) // length + 1):
+            try:
+                blocks.append(self.get_block.caching_call(index))
+            except AttributeError:
+                blocks.append(self.get_block(index))
+
+        offset = first * length
+        data = blocks[0] if len(blocks) == 1 else np.concatenate(blocks, axis=t_axis)
+        return data[prefix + (slice(start - offset, stop - offset, step),)]
+
+    def get_memmap(self) -> np.memmap | None:
+        """Gets a read only memory map of the data when it is stored contiguously and uncompressed in the file.
+
+        The map outlives the HDF5 file handle, and reading it after the file is rewritten or truncated can crash the
+        interpreter with SIGBUS, see HDF5Dataset.get_memmap.
+
+        Returns:
+            The memory map of the data or None if the data cannot be mapped.
+        """
+        return self.composite.get_memmap()
+
+    def slices_array(
+        self,
+        slices: Iterable[slice | int | None] | None = None,
+        dtype: Any = None,
+        mapped: bool = False,
+    ) -> np.ndarray:
+        """Gets a range of data as an array, reading contiguous selections directly into a new array.
+
+        Args:
+            slices: The ranges to get the data from.
+            dtype: The dtype of array to return.
+            mapped: Determines if a read only view of the memory map from get_memmap is returned, when the data can be
+                mapped, instead of a copy. See get_memmap for the lifetime of the map.
+
+        Returns:
+            The requested range as an array.
+        """
+        slices = () if slices is None else tuple(slices)
+        composite = self.composite
+        shape = composite.shape
+        memmap = None if not mapped or composite.file.swmr_mode else self.get_memmap()
+
+        if memmap is not None:
+            data = memmap[slices]
+        elif composite.file.swmr_mode or len(slices) > len(shape) or not all(
+            isinstance(s, slice) and s.step in (None, 1) for s in slices
+        ):
+            data = composite[slices]
+        else:
+            selection = tuple(slice(*s.indices(n)[:2]) for s, n in zip(slices, shape))
+            out_shape = tuple(max(s.stop - s.start, 0) for s in selection) + shape[len(selection):]
+            if 0 in out_shape:
+                data = composite[slices]
+            else:
+                with composite:
+                    dataset = composite._dataset
+                    data = np.empty(out_shape, dtype=dataset.dtype)
+                    dataset.read_direct(data, source_sel=selection if selection else None)
+
+        return data if dtype is None else data.astype(dtype)
+
+    # Find
+    def find_data_ranges(
+        self,
+        starts: Iterable[datetime.datetime | float] | np.ndarray,
+        stops: Iterable[datetime.datetime | float] | np.ndarray,
+    ) -> list[FoundRange]:
+        """Finds the data within many time ranges at once, where overlapping ranges share one read.
+
+        The ranges are clipped to the data and an empty range gives an empty FoundRange. Numbers are timestamps in
+        seconds and uint64 values are nanostamps, the same units as nanostamp.
+
+        Args:
+            starts: The start times of the ranges.
+            stops: The stop times of the ranges, inclusive.
+
+        Returns:
+            The data within each range with its start and stop indices.
+        """
+        nanostamps = self.time_axis.nanostamps
+        starts = to_nanostamps(starts).astype(nanostamps.dtype, copy=False)
+        stops = to_nanostamps(stops).astype(nanostamps.dtype, copy=False)
+        start_indices = np.searchsorted(nanostamps, starts, side="left")
+        stop_indices = np.searchsorted(nanostamps, stops, side="right")
+
+        # Merge the overlapping and adjacent ranges into spans which are each read once.
+        spans = []
+        for i in np.argsort(start_indices, kind="stable"):
+            start, stop = int(start_indices[i]), int(stop_indices[i])
+            if stop <= start:
+                continue
+            elif spans and start <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], stop)
+                spans[-1][2].append(i)
+            else:
+                spans.append([start, stop, [i]])
+
+        _, prefix, _ = self.get_layout()
+        found = [FoundRange(None, None, None)] * len(start_indices)
+        with self.composite:
+            for span_start, span_stop, members in spans:
+                data = self.composite[prefix + (slice(span_start, span_stop),)]
+                for i in members:
+                    start, stop = int(start_indices[i]), int(stop_indices[i])
+                    found[i] = FoundRange(data[prefix + (slice(start - span_start, stop - span_start),)], start, stop)
+        return found
+
     # Axes
     def create_time_axis(
         self,
@@ -240,12 +454,12 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
             start=start,
             stop=stop,
             step=step,
-            rate=self._sample_rate if rate is None else rate,
+            rate=self._sample_rate_ if rate is None else rate,
             size=size,
             datetimes=datetimes,
             scale_name=self.scale_name,
             require=True,
-            file=self.file,
+            file=self.composite.file,
             **kwargs,
         )
 
@@ -324,7 +538,8 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
             self.scale_name = scale_name
 
         if sample_rate is not None:
-            self._sample_rate = sample_rate
+            self._sample_rate_ = sample_rate if isinstance(sample_rate, Decimal) else Decimal(sample_rate)
+            kwargs.setdefault("rate", sample_rate)
 
         self.create_time_axis(**kwargs)
 
@@ -372,7 +587,8 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
             self.scale_name = scale_name
 
         if sample_rate is not None:
-            self._sample_rate = sample_rate
+            self._sample_rate_ = sample_rate if isinstance(sample_rate, Decimal) else Decimal(sample_rate)
+            kwargs.setdefault("rate", sample_rate)
 
         self.require_time_axis(**kwargs)
 
@@ -398,15 +614,16 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
         self.require_component(t_axis=t_axis, scale_name=scale_name, sample_rate=sample_rate)
         return self.composite
 
-    def set_data_component(self, data: np.ndarray, **kwargs: Any) -> None:
+    def set_data_component(self, data: np.ndarray, size: int | None = None, **kwargs: Any) -> None:
         """Sets the data pertaining to this component.
 
         Args:
             data: The replacement data.
+            size: The number of samples in the time series, if known, for when the time axis is created.
             **kwargs: The keyword arguments for creating the component.
         """
         if self._time_axis is None:
-            self.require_component(**kwargs)
+            self.require_component(datetimes=data, size=size, **kwargs)
         else:
             self._time_axis.set_data(data=data, **kwargs)
 
@@ -424,7 +641,7 @@ class TimeSeriesComponent(BaseDatasetComponent, ContainerTimeSeries):
             **kwargs: The keyword arguments for the HDF5Dataset.
         """
         self.composite.require_data(data=data, **kwargs)
-        self.set_data_component(data=timestamps)
+        self.set_data_component(data=timestamps, size=None if data is None else data.shape[self.t_axis])
 
     def append_component(self, data: np.ndarray, **kwargs: Any) -> None:
         """Append data to this component.
@@ -13,14 +13,19 @@ __email__ = __email__
 
 # Imports #
 # Standard Libraries #
+from collections.abc import Iterable
+from contextlib import contextmanager
+from functools import total_ordering
 import pathlib
 import datetime
 from typing import Any
 
 # Third-Party Packages #
+from baseobjects import search_sentinel
 from classversioning import VersionType, TriNumberVersion, Version
 from dspobjects.time import Timestamp, nanostamp
 import h5py
+import numpy as np
 
 # Local Packages #
 from ..hdf5bases import HDF5Map, HDF5Dataset
@@ -47,6 +52,7 @@ class HDF5EEGMap(BaseHDF5Map):
     default_maps = {"data": BaseTimeSeriesMap()}
 
 
+@total_ordering
 class HDF5EEG(BaseHDF5):
     """A HDF5 file which contains data for EEG data.
 
@@ -56,9 +62,14 @@ class HDF5EEG(BaseHDF5):
         FILE_TYPE: The file type name of this class.
         VERSION: The version of this class.
         default_map: The HDF5 map of this object.
+        default_rdcc_nbytes: The default size of the chunk cache in bytes when opening the file.
+        default_rdcc_nslots: The default number of slots in the chunk cache, which should be prime.
 
     Attributes:
         _subject_id: The ID of the EEG subject data.
+        _start_attribute: The cached start nanostamp from the file.
+        _end_attribute: The cached end nanostamp from the file.
+        _data: The cached main EEG dataset, which is cleared when the file closes.
         _subject_dir: The directory where subjects data are stored.
 
     Args:
@@ -75,6 +86,24 @@ class HDF5EEG(BaseHDF5):
     VERSION: Version = TriNumberVersion(0, 0, 0)
     FILE_TYPE: str = "EEG"
     default_map: HDF5Map = HDF5EEGMap()
+    default_rdcc_nbytes: int = 64 * 1024 * 1024
+    default_rdcc_nslots: int = 100003
+
+    # Class Methods #
+    @classmethod
+    def generate_file_name(cls, s_id: str, start: datetime.datetime | float | int | np.uint64) -> str:
+        """Generates a file name from the subject ID and the start time of the data.
+
+        Args:
+            s_id: The subject id.
+            start: The start time of the data, which is interpreted as by nanostamp and named in UTC.
+
+        Returns:
+            The file name.
+        """
+        # Every start goes through nanostamp, like the start attribute, so the same instant always gives the same name.
+        start = Timestamp.fromnanostamp(nanostamp(start), tz=datetime.timezone.utc)
+        return f"{s_id}_{start.strftime('%Y-%m-%d_%H~%M~%S')}.h5"
 
     # Magic Methods #
     # Construction/Destruction
@@ -88,6 +117,9 @@ class HDF5EEG(BaseHDF5):
     ) -> None:
         # New Attributes #
         self._subject_id: str = ""
+        self._start_attribute: int | None | Any = search_sentinel
+        self._end_attribute: int | None | Any = search_sentinel
+        self._data: HDF5Dataset | None = None
 
         # Parent Attributes #
         super().__init__(init=False)
@@ -98,8 +130,11 @@ class HDF5EEG(BaseHDF5):
 
     @property
     def subject_id(self) -> str:
-        """The subject ID from the file attributes."""
-        return self.attributes["subject_id"]
+        """The subject ID from the file attributes, falling back to the local ID if the file does not have one."""
+        try:
+            return self.attributes.get_attribute("subject_id")
+        except KeyError:
+            return self._subject_id
 
     @subject_id.setter
     def subject_id(self, value: str) -> None:
@@ -115,51 +150,59 @@ class HDF5EEG(BaseHDF5):
     @property
     def start_nanostamp(self) -> float | None:
         """The start timestamp of this file."""
-        if (ns := self.attributes.get("start", None)) is None:
-            if len(self["data"]) > 0:
-                return self["data"].components["timeseries"].get_nanostamp(0)
+        if self._start_attribute is search_sentinel:
+            self._start_attribute = self.attributes.get("start", None)
+        if (ns := self._start_attribute) is None:
+            data = self.data
+            if len(data) > 0:
+                return data.components["timeseries"].get_nanostamp(0)
         return ns
 
     @property
     def start_timestamp(self) -> float | None:
         """The start timestamp of this file."""
         ns = self.start_nanostamp
-        return None if ns is None else ns * 10**9
+        return None if ns is None else ns / 10**9
 
     @property
     def end_datetime(self) -> Timestamp | None:
         """The end datetime of this file."""
-        ns = self.attributes.get("end", None)
+        ns = self.end_nanostamp
         return None if ns is None else Timestamp.fromnanostamp(ns)
 
     @property
     def end_nanostamp(self) -> float | None:
         """The end timestamp of this file."""
-        return self.attributes.get("end", None)
+        if self._end_attribute is search_sentinel:
+            self._end_attribute = self.attributes.get("end", None)
+        return self._end_attribute
 
     @property
     def end_timestamp(self) -> float | None:
         """The end timestamp of this file."""
-        ns = self.attributes.get("end", None)
-        return None if ns is None else ns * 10**9
+        ns = self.end_nanostamp
+        return None if ns is None else ns / 10**9
 
     @property
     def sample_rate(self) -> float | int:
         """The sample rate of the data."""
-        return self["data"].components["timeseries"].sample_rate
+        return self.data.components["timeseries"].sample_rate
 
     @sample_rate.setter
     def sample_rate(self, value: int | float) -> None:
-        self["data"].components["timeseries"].sample_rate = value
+        self.data.components["timeseries"].sample_rate = value
 
     @property
     def time_axis(self) -> HDF5Dataset:
         """The time axis of the data."""
-        return self["data"].axes[0]["time_axis"]
+        return self.data.axes[0]["time_axis"]
 
     @property
     def data(self) -> HDF5Dataset:
-        return self["data"]
+        """The main EEG dataset, which is looked up once while the file is open."""
+        if self._data is None:
+            self._data = self["data"]
+        return self._data
 
     # Representation
     def __hash__(self) -> int:
@@ -172,46 +215,28 @@ class HDF5EEG(BaseHDF5):
 
     # Comparison
     def __eq__(self, other: Any) -> bool:
-        """The equals operator implementation."""
-        if isinstance(other, HDF5EEG):
-            return self.start == other.start
-        else:
-            return self.start == other
-
-    def __ne__(self, other: Any) -> bool:
-        """The not equals operator implementation."""
-        if isinstance(other, HDF5EEG):
-            return self.start != other.start
-        else:
-            return self.start != other
+        """The equals operator implementation, which compares the start times."""
+        if self is other:
+            return True
+        other_start = self._other_start(other)
+        if other_start is NotImplemented:
+            return NotImplemented
+        return self.start_nanostamp == other_start
 
     def __lt__(self, other: Any) -> bool:
-        """The less than operator implementation."""
-        if isinstance(other, HDF5EEG):
-            return self.start < other.start
-        else:
-            return self.start < other
+        """The less than operator implementation, which compares the start times.
 
-    def __gt__(self, other: Any) -> bool:
-        """The greater than operator implementation."""
-        if isinstance(other, HDF5EEG):
-            return self.start > other.start
-        else:
-            return self.start > other
-
-    def __le__(self, other: Any) -> bool:
-        """The less than or equals operator implementation."""
-        if isinstance(other, HDF5EEG):
-            return self.start <= other.start
-        else:
-            return self.start <= other
-
-    def __ge__(self, other: Any) -> bool:
-        """The greater than or equals operator implementation."""
-        if isinstance(other, HDF5EEG):
-            return self.start >= other.start
-        else:
-            return self.start >= other
+        Files without a start time are ordered after all files with a start time.
+        """
+        if self is other:
+            return False
+        other_start = self._other_start(other)
+        if other_start is NotImplemented:
+            return NotImplemented
+        start = self.start_nanostamp
+        if start is None:
+            return False
+        return other_start is None or start < other_start
 
     # Instance Methods
     # Constructors/Destructors
@@ -257,9 +282,11 @@ class HDF5EEG(BaseHDF5):
             require: Determines if this object will create and fill the attributes in the file on construction.
         """
         super().construct_file_attributes(map_=map_, load=load, require=require)
-        self.attributes["subject_id"] = self._subject_id
-        if start is not None:
-            self.attributes["start"] = nanostamp(start)
+        if start is None:
+            self.attributes["subject_id"] = self._subject_id
+        else:
+            self._start_attribute = nanostamp(start)
+            self.attributes.update(subject_id=self._subject_id, start=self._start_attribute)
 
     def construct_dataset(self, load: bool = False, require: bool = False, **kwargs: Any) -> None:
         """Constructs the main EEG dataset.
@@ -281,6 +308,23 @@ class HDF5EEG(BaseHDF5):
         """
         return self._group.construct_member(name="data", load=load, require=require, **kwargs)
 
+    # Comparison
+    def _other_start(self, other: Any) -> int | None | Any:
+        """Gets the start nanostamp of the other operand of a comparison.
+
+        Args:
+            other: The other operand, either an HDF5EEG or a time.
+
+        Returns:
+            The start nanostamp of the other operand or NotImplemented if it is not a time.
+        """
+        if isinstance(other, HDF5EEG):
+            return other.start_nanostamp
+        try:
+            return nanostamp(other)
+        except TypeError:
+            return NotImplemented
+
     # File
     def create_file(
         self,
@@ -302,8 +346,58 @@ class HDF5EEG(BaseHDF5):
         if s_id is not None:
             self._subject_id = s_id
 
+        if name is None and self.path is None and start is not None:
+            name = self.generate_file_name(s_id=self._subject_id, start=start)
+            if s_dir is not None:
+                name = pathlib.Path(s_dir, name)
+
         super().create_file(name=name, **kwargs)
 
+    def open(self, mode: str | None = None, exc: bool = False, **kwargs: Any) -> "HDF5EEG":
+        """Opens the HDF5 file with a chunk cache large enough to hold the chunks of multichannel EEG data.
+
+        Args:
+            mode: The mode which this file should be opened in.
+            exc: Determines if an error should be excepted as warning or not.
+            kwargs: The keyword arguments for opening the HDF5 file.
+
+        Returns:
+            This object.
+        """
+        kwargs.setdefault("rdcc_nbytes", self.default_rdcc_nbytes)
+        kwargs.setdefault("rdcc_nslots", self.default_rdcc_nslots)
+        return super().open(mode=mode, exc=exc, **kwargs)
+
+    @contextmanager
+    def temp_open(self, **kwargs: Any) -> "HDF5EEG":
+        """Temporarily opens the file if it is not already open.
+
+        While this opens the file, the time axis keeps its cached arrays, so repeated searches do not read the axis
+        again. The cached arrays are cleared when the file closes.
+
+        Args:
+            **kwargs: The keyword arguments for opening the HDF5 file.
+
+        Returns:
+            This object.
+        """
+        was_open = self.is_open or self._is_open
+        with super().temp_open(**kwargs):
+            try:
+                axis = None if was_open else self.time_axis.components["axis"]
+            except (KeyError, IndexError):
+                axis = None  # The file does not have data yet.
+
+            if axis is None:
+                yield self
+            else:
+                axis.timeless_caching()
+                try:
+                    yield self
+                finally:
+                    axis.timed_caching()
+                    axis.clear_caches()
+
     def close(self) -> bool:
         """Closes the HDF5 file.
 
@@ -312,8 +406,37 @@ class HDF5EEG(BaseHDF5):
         """
         try:
             self.standardize_attributes()
-        finally:
-            return super().close()
+        except Exception:
+            pass  # The file should still close even if its attributes cannot be standardized.
+        self._data = None
+        self._start_attribute = search_sentinel
+        self._end_attribute = search_sentinel
+        return super().close()
+
+    def refresh(self) -> None:
+        """Reloads the attributes and members from the file and clears the cached start and end."""
+        self._start_attribute = search_sentinel
+        self._end_attribute = search_sentinel
+        self._group.refresh()
+
+    # Find
+    def find_time_indices(
+        self,
+        timestamps: Iterable[datetime.datetime | float] | np.ndarray,
+        approx: bool = True,
+        tails: bool = False,
+    ) -> np.ndarray:
+        """Finds the indices of many times in the data at once.
+
+        Args:
+            timestamps: The timestamps to find the indices for.
+            approx: Determines if approximate indices will be given if the times are not present.
+            tails: Determines if the first or last index will be give the requested time is outside the data.
+
+        Returns:
+            The index of each time or the closest index before it.
+        """
+        return self.time_axis.components["axis"].find_time_indices(timestamps, approx=approx, tails=tails)
 
     # Attributes Modification
     def validate_attributes(self) -> bool:
@@ -322,14 +445,23 @@ class HDF5EEG(BaseHDF5):
         Returns:
             If the attributes are valid.
         """
-        return self.start == self.time_axis.start and self.end == self.data._time_axis.end
+        attributes = self.attributes
+        axis = self.time_axis.components["axis"]
+        return (
+            attributes.get("start", None) == axis.start_nanostamp
+            and attributes.get("end", None) == axis.end_nanostamp
+        )
 
     def standardize_attributes(self) -> None:
         """Sets attributes that correspond to values somewhere else to their current values."""
         if self.mode in {"w", "a"} and not self.swmr_mode:
-            if self.data.exists:
-                self.data.standardize_attributes()
-
-            if self.time_axis.exists:
-                self.attributes["start"] = self.time_axis.components["axis"].start_nanostamp
-                self.attributes["end"] = self.time_axis.components["axis"].end_nanostamp
+            data = self.data
+            if data.exists:
+                data.standardize_attributes()
+
+            time_axis = data.axes[0]["time_axis"]
+            if time_axis.exists:
+                axis = time_axis.components["axis"]
+                self._start_attribute = axis.start_nanostamp
+                self._end_attribute = axis.end_nanostamp
+                self.attributes.update(start=self._start_attribute, end=self._end_attribute)
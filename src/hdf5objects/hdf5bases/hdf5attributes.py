@@ -42,6 +42,7 @@ class HDF5Attributes(HDF5BaseObject):
     Attributes:
         _attribute_manager: The HDF5 attribute_manager to wrap.
         _attributes_dict: A cache to hold the attributes in.
+        _pending_attributes: Attributes set before this object exists, which are written when it is created.
 
     Args:
         attributes: The HDF5 attribute_manager to build this attribute_manager around.
@@ -77,6 +78,7 @@ class HDF5Attributes(HDF5BaseObject):
         # New Attributes #
         self._attribute_manager: h5py.AttributeManager | None = None
         self._attributes_dict: TimedDict = TimedDict()
+        self._pending_attributes: dict[str, Any] = {}
 
         # Parent Attributes #
         super().__init__(init=False)
@@ -193,6 +195,11 @@ class HDF5Attributes(HDF5BaseObject):
                 elif override:
                     self._attribute_manager[name] = value
 
+            for name, value in self._pending_attributes.items():
+                self._attribute_manager[name] = value
+                self._attributes_dict.pop(name, None)
+            self._pending_attributes.clear()
+
     def construct_components(
         self,
         component_kwargs: dict[str, dict[str, Any]] | None = None,
@@ -290,6 +297,8 @@ class HDF5Attributes(HDF5BaseObject):
         """
         name = self._parse_name(name)
         value = self._attributes_dict.get(name, self.sentinel)
+        if value is self.sentinel:
+            value = self._pending_attributes.get(name, self.sentinel)
         if value is self.sentinel:
             with self:
                 if name in self._attribute_manager:
@@ -416,13 +425,30 @@ class HDF5Attributes(HDF5BaseObject):
     def update(self, **items) -> None:
         """Updates the file attributes based on the dictionary update scheme.
 
+        All the attributes are written within one opening of the file and the cached values are only dropped, so
+        they are read back when they are next used rather than after each write. If this object does not exist yet,
+        the attributes are kept on this object and written when it is created.
+
         Args:
             **items: The keyword arguments which are the attributes and their values.
         """
-        with self:
+        try:
+            self.open()
+        except KeyError:  # This object is not in the file yet, which is found without checking if it exists first.
+            if not self._file_was_open:
+                self.file.close()
+            for name, value in items.items():
+                self._pending_attributes[self._parse_name(name)] = value
+            return
+
+        try:
+            attribute_manager = self._attribute_manager
             for name, value in items.items():
                 name = self._parse_name(name)
-                self._attribute_manager[name] = value
+                attribute_manager[name] = value
+                self._attributes_dict.pop(name, None)
+        finally:
+            self.close()
 
     def pop(self, key: str) -> Any:
         """Gets an attribute and deletes it from this object.
@@ -443,6 +469,15 @@ class HDF5Attributes(HDF5BaseObject):
             self._attribute_manager.clear()
 
     # File
+    def _is_wrapped_valid(self) -> bool:
+        """Checks if the wrapped attribute manager is valid, which means its file is open.
+
+        Returns:
+            If the wrapped attribute manager is valid.
+        """
+        # An attribute manager evaluates to False when it has no attributes, so its id is checked instead.
+        return self._attribute_manager is not None and self._attribute_manager._id.valid
+
     def open(self, mode: str = "a", **kwargs: Any) -> "HDF5Attributes":
         """Opens the file to make this dataset usable.
 
@@ -453,6 +488,10 @@ class HDF5Attributes(HDF5BaseObject):
         Returns:
             This object.
         """
+        if self._is_held_open():  # Already opened by an outer context, so the file does not need to be checked.
+            self._open_depth += 1
+            return self
+
         self._file_was_open = self.file.is_open
         if not self._file_was_open:
             self.file.open(mode=mode, **kwargs)
@@ -463,10 +502,16 @@ class HDF5Attributes(HDF5BaseObject):
         except ValueError:
             self._attribute_manager = self.file._file[self._full_name].attrs
 
+        self._open_depth = 1
         return self
 
     def close(self) -> None:
-        """Closes the file of this object."""
+        """Closes the file of this object once the outermost context which opened it exits."""
+        if self._open_depth > 1:
+            self._open_depth -= 1
+            return
+
+        self._open_depth = 0
         if not self._file_was_open:
             self.file.close()
         elif self.file.mode not in {"w", "a"} and self.file._reopen and self.file.swmr_mode:
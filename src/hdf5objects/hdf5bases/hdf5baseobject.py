@@ -14,6 +14,7 @@ __email__ = __email__
 # Imports #
 # Standard Libraries #
 from collections.abc import Mapping
+from functools import lru_cache
 import pathlib
 from typing import Any
 import weakref
@@ -32,6 +33,22 @@ from .hdf5map import HDF5Map
 
 
 # Definitions #
+# Functions #
+@lru_cache(maxsize=1024)
+def intern_parents(parent: str) -> tuple[str, ...]:
+    """Gets a shared tuple of parents for a parent path without leading separators.
+
+    The cache is bounded, so objects with the same recently used parents share one tuple.
+
+    Args:
+        parent: The parent path to get the parents of.
+
+    Returns:
+        The parents of the path.
+    """
+    return (parent,) if "/" not in parent else tuple(parent.split("/"))
+
+
 # Classes #
 class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=CachingInitMeta):
     """An abstract wrapper which wraps object from an HDF5 file and gives more functionality.
@@ -40,14 +57,17 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
         sentinel: An object that helps with mapping searches.
         file_type: The type of the file to use when creating a file object.
         default_map: The map of this HDF5 object.
+        _wrap_attribute: The name of the first attribute in _wrap_attributes, which holds the HDF5 object.
 
     Attributes:
         _file_was_open: Determines if the file object was open when this dataset was accessed.
+        _open_depth: The number of nested contexts which currently have this object open.
         _file: The file object that this HDF5 object originates from.
         _name_: The HDF5 name of this object.
-        _parents: The parents of this object as a list.
+        _parents: The parents of this object as a tuple which is shared with objects that have the same parents.
+        _full_name_cache: The cached full hdf5 name of this object, None when it must be rebuilt.
         _mode_: The edit mode of this object.
-        map: The map of this HDF5 object.
+        _map: The map of this HDF5 object, None until it is set or the default map is copied.
         components: The components of this composite object.
 
     Args:
@@ -63,8 +83,19 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
     file_type: type | None = None
     default_map: HDF5Map | None = None
     write_modes: set[str] = {"a", "r+"}
+    _wrap_attribute: str | None = None
 
     # Class Methods #
+    # Construction/Destruction
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """The init when creating a subclass.
+
+        Args:
+            **kwargs: The keyword arguments for creating a subclass.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._wrap_attribute = cls._wrap_attributes[0] if cls._wrap_attributes else None
+
     # Wrapped Attribute Callback Functions
     @classmethod
     def _get_attribute(cls, obj: Any, wrap_name: str, attr_name: str) -> Any:
@@ -78,6 +109,8 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
         Returns:
             The wrapped object.
         """
+        if obj._is_held_open():  # Already open, so the open and close of the context can be skipped.
+            return super()._get_attribute(obj, wrap_name, attr_name)
         with obj:  # Ensures the hdf5 dataset is open when accessing attributes
             return super()._get_attribute(obj, wrap_name, attr_name)
 
@@ -91,8 +124,11 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
             attr_name: The attribute name of the attribute to set from the wrapped object.
             value: The object to set the wrapped fileobjects attribute to.
         """
-        with obj:  # Ensures the hdf5 dataset is open when accessing attributes
+        if obj._is_held_open():  # Already open, so the open and close of the context can be skipped.
             super()._set_attribute(obj, wrap_name, attr_name, value)
+        else:
+            with obj:  # Ensures the hdf5 dataset is open when accessing attributes
+                super()._set_attribute(obj, wrap_name, attr_name, value)
 
     @classmethod
     def _del_attribute(cls, obj: Any, wrap_name: str, attr_name: str) -> None:
@@ -103,8 +139,11 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
             wrap_name: The attribute name of the wrapped object.
             attr_name: The attribute name of the attribute to delete from the wrapped object.
         """
-        with obj:  # Ensures the hdf5 dataset is open when accessing attributes
+        if obj._is_held_open():  # Already open, so the open and close of the context can be skipped.
             super()._del_attribute(obj, wrap_name, attr_name)
+        else:
+            with obj:  # Ensures the hdf5 dataset is open when accessing attributes
+                super()._del_attribute(obj, wrap_name, attr_name)
 
     @classmethod
     def _evaluate_method(cls, obj: Any, wrap_name: str, method_name: str, args: Any, kwargs: Any) -> Any:
@@ -120,6 +159,8 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
         Returns:
             The wrapped object.
         """
+        if obj._is_held_open():  # Already open, so the open and close of the context can be skipped.
+            return super()._get_attribute(obj, wrap_name, method_name)(*args, **kwargs)
         with obj:  # Ensures the hdf5 dataset is open when accessing attributes
             return super()._get_attribute(obj, wrap_name, method_name)(*args, **kwargs)
 
@@ -138,17 +179,19 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
     ) -> None:
         # New Attributes #
         self._file_was_open: bool | None = None
+        self._open_depth: int = 0
         self._weak_signal: weakref.ref | None = None
         self._weak_file: weakref.ref | None = None
         self._file: h5py.File | "HDF5File" | None = None
         self._get_file: AnyCallable = self._get_weak_file.__func__
 
         self._name_: str | None = None
-        self._parents: list[str] | None = None
+        self._parents: tuple[str, ...] | list[str] | None = None
+        self._full_name_cache: str | None = None
 
         self._mode_: str | None = None
 
-        self.map: HDF5Map = self.default_map.deepcopy()
+        self._map: HDF5Map | None = None
 
         # Parent Attributes #
         super().__init__(init=init)
@@ -171,23 +214,39 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
         """Concatenates the parents into one str. The setter supports parsing a full hdf5 name."""
         if self._parents is None:
             return "/"
+        elif self._parents:
+            return "/" + "/".join(self._parents)
         else:
-            return "".join(f"/{p}" for p in self._parents)
+            return ""
 
     @_parent.setter
     def _parent(self, value: str | None):
         if value is None:
             self._parents = None
+            self._full_name_cache = None
         else:
             self.set_parent(parent=value)
 
     @property
     def _full_name(self) -> str:
         """Returns the full hdf5 name of this map."""
-        if self._parents is None:
-            return f"/{self._name_}"
-        else:
-            return f"{''.join(f'/{p}' for p in self._parents)}/{'' if self._name is None else self._name_}"
+        if self._full_name_cache is None:
+            if self._parents is None:
+                self._full_name_cache = f"/{self._name_}"
+            else:
+                self._full_name_cache = f"{self._parent}/{'' if self._name_ is None else self._name_}"
+        return self._full_name_cache
+
+    @property
+    def map(self) -> HDF5Map:
+        """The map of this HDF5 object, the default map is only copied if no other map was set before it is used."""
+        if self._map is None:
+            self._map = self.default_map.deepcopy()
+        return self._map
+
+    @map.setter
+    def map(self, value: HDF5Map) -> None:
+        self._map = value
 
     @property
     def _mode(self) -> str:
@@ -243,6 +302,7 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
             dict: A dictionary of this object's attributes.
         """
         state = super().__getstate__()
+        state["_open_depth"] = 0
 
         weak_file = state.pop("_weak_file")
         if weak_file is not None:
@@ -282,21 +342,24 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
     def __getitem__(self, key: Any) -> Any:
         """Ensures HDF5 object is open for getitem"""
         with self:
-            return getattr(self, self._wrap_attributes[0])[key]
+            return getattr(self, self._wrap_attribute)[key]
 
     def __setitem__(self, key: Any, value: Any) -> None:
         """Ensures HDF5 object is open for setitem"""
         with self:
-            getattr(self, self._wrap_attributes[0])[key] = value
+            getattr(self, self._wrap_attribute)[key] = value
 
     def __delitem__(self, key: Any) -> None:
         """Ensures HDF5 object is open for delitem"""
         with self:
-            del getattr(self, self._wrap_attributes[0])[key]
+            del getattr(self, self._wrap_attribute)[key]
 
     # Context Managers
     def __enter__(self) -> "HDF5BaseObject":
         """The enter context which opens the file to make this dataset usable"""
+        if self._is_held_open():  # Already open, so only the depth needs to be counted without calling open.
+            self._open_depth += 1
+            return self
         return self.open()
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -310,7 +373,7 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
         Returns:
             bool: If this object is open or not.
         """
-        return bool(getattr(self, self._wrap_attributes[0]))
+        return bool(getattr(self, self._wrap_attribute))
 
     # Instance Methods #
     # Constructors/Destructors
@@ -339,11 +402,13 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
             self.set_parent(parent=parent)
         elif map_ is not None:
             self._parents = self.map.parents
+            self._full_name_cache = None
 
         if name is not None:
             self.set_name(name=name)
         elif map_ is not None:
             self._name_ = self.map.name
+            self._full_name_cache = None
 
         if mode is not None:
             self.set_mode(mode)
@@ -377,13 +442,48 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
     def is_exist(self) -> bool:
         """Determine if this object exists in the HDF5 file."""
         with self.file.temp_open():
-            try:
-                self.file._file[self._full_name]
-                return True
-            except KeyError:
+            h5_file = self.file._file
+            full_name = self._full_name
+            if full_name not in h5_file:  # Checks the links of the path without opening the object.
                 return False
 
+            try:
+                link = h5_file.get(full_name, getlink=True)
+            except RuntimeError:  # The root group has no link to get.
+                link = None
+
+            # Soft and external links can dangle, so their target must be opened to check that it exists.
+            if link is not None and not isinstance(link, h5py.HardLink):
+                try:
+                    h5_file[full_name]
+                except KeyError:
+                    return False
+
+            return True
+
     # File
+    def _is_wrapped_valid(self) -> bool:
+        """Checks if the wrapped HDF5 object is valid, which means its file is open.
+
+        Returns:
+            If the wrapped HDF5 object is valid.
+        """
+        return bool(getattr(self, self._wrap_attribute))
+
+    def _is_held_open(self) -> bool:
+        """Checks if an outer context has this object open, resetting the depth if its file was closed since.
+
+        Returns:
+            If this object is open within an outer context.
+        """
+        if not self._open_depth:
+            return False
+        elif self._is_wrapped_valid():
+            return True
+
+        self._open_depth = 0  # The file was closed under the outer context, so this object must be opened again.
+        return False
+
     def open(self, mode: str = "a", **kwargs: Any) -> "HDF5BaseObject":
         """Opens the file to make this dataset usable.
 
@@ -394,17 +494,28 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
         Returns:
             This object.
         """
-        self._file_was_open = self.file.is_open
-        if not self._file_was_open:
-            self.file.open(mode=mode, **kwargs)
+        if self._is_held_open():  # Already opened by an outer context, so the file does not need to be checked.
+            self._open_depth += 1
+            return self
 
-        if not getattr(self, self._wrap_attributes[0]):
-            setattr(self, self._wrap_attributes[0], self.file._file[self._full_name])
+        if getattr(self, self._wrap_attribute):  # A valid HDF5 object means its file is open.
+            self._file_was_open = True
+        else:
+            self._file_was_open = self.file.is_open
+            if not self._file_was_open:
+                self.file.open(mode=mode, **kwargs)
+            setattr(self, self._wrap_attribute, self.file._file[self._full_name])
 
+        self._open_depth = 1
         return self
 
     def close(self) -> None:
-        """Closes the file of this dataset."""
+        """Closes the file of this dataset once the outermost context which opened it exits."""
+        if self._open_depth > 1:
+            self._open_depth -= 1
+            return
+
+        self._open_depth = 0
         if not self._file_was_open:
             self.file.close()
 
@@ -461,9 +572,8 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
         Args:
             parent: The str to parse and set as the parent of this map.
         """
-        parent = parent.lstrip("/")
-        parts = parent.split("/")
-        self._parents = parts
+        self._parents = intern_parents(parent.lstrip("/"))
+        self._full_name_cache = None
 
     def set_name(self, name: str | None) -> None:
         """Sets the name of this object, can be a full hdf5 name.
@@ -475,16 +585,14 @@ class HDF5BaseObject(StaticWrapper, CachingObject, BaseComposite, metaclass=Cach
             self._name_ = None
         else:
             name = name.lstrip("/")
-            parts = name.split("/")
-            name = parts.pop(-1)
+            index = name.rfind("/")
+            if index >= 0:  # Only a full hdf5 name needs to be split into its parents.
+                self._parents = intern_parents(name[:index])
+                name = name[index + 1 :]
 
-            if name == "":
-                self._name_ = "/"
-            else:
-                self._name_ = name
+            self._name_ = name if name else "/"
 
-            if parts:
-                self._parents = parts
+        self._full_name_cache = None
 
     def set_mode(self, mode: str, timed: bool = True, **kwargs: Any) -> None:
         """Sets the edit mode of this object.
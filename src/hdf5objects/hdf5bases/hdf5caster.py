@@ -15,12 +15,14 @@ __email__ = __email__
 # Standard Libraries #
 import datetime as datetime
 import uuid as uuid
+from collections.abc import Iterable
+from types import MappingProxyType
 from typing import Any
 
 # Third-Party Packages #
 from baseobjects import BaseObject, search_sentinel
-from baseobjects.functions import singlekwargdispatch
 from baseobjects.operations import timezone_offset
+from baseobjects.typing import AnyCallable
 import numpy as np
 import h5py
 
@@ -37,23 +39,45 @@ class HDF5Caster(BaseObject):
 
     Class Attributes:
         _pass_types: A type union of the types to return with no modification.
-        pass_types: The types to return with no modification.
+        pass_types: The types to return with no modification, kept as a small tuple to be checked by identity.
         type_map: A map of python types and their HDF5 representation.
+        from_registry: A map of methods to use to cast a python type to its HDF5 representation.
         to_registry: A map of methods to use to cast an HDF5 representation to its correct python type.
+        _from_methods: The from_registry with its methods bound to the class.
+        _to_methods: The to_registry with its methods bound to the class.
     """
 
     _pass_types = int | float | bytes | np.dtype | h5py.Reference
-    pass_types = {int, float, bytes, np.dtype, h5py.Reference}
-    type_map = {
-        bytes: STRING_TYPE,
-        str: STRING_TYPE,
-        datetime.datetime: float,
-        datetime.tzinfo: float,
-        datetime.timedelta: float,
-        uuid.UUID: STRING_TYPE,
-    }
+    pass_types = (int, float, bytes, np.dtype, h5py.Reference)
+    type_map = MappingProxyType(
+        {
+            bytes: STRING_TYPE,
+            str: STRING_TYPE,
+            datetime.datetime: float,
+            datetime.tzinfo: float,
+            datetime.timedelta: float,
+            uuid.UUID: STRING_TYPE,
+        }
+    )
+
+    _from_methods: dict[type, AnyCallable] = {}
+    _to_methods: dict[type, AnyCallable] = {}
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Binds the registries of the subclass when it is created."""
+        super().__init_subclass__(**kwargs)
+        cls.bind_registries()
 
     # Class Methods #
+    # Registries
+    @classmethod
+    def bind_registries(cls) -> None:
+        """Binds the methods of the registries to this class, so they can be called without binding on every cast."""
+        cls._from_methods = {type_: method.__get__(None, cls) for type_, method in cls.from_registry.items()}
+        cls._to_methods = {type_: method.__get__(None, cls) for type_, method in cls.to_registry.items()}
+
     # Map Type
     @classmethod
     def map_type(cls, type_: Any) -> Any:
@@ -65,7 +89,7 @@ class HDF5Caster(BaseObject):
         Returns:
             The type which is an HDF5 representation of the given type.
         """
-        if type_ in cls.pass_types:
+        if type_ is int or type_ is float or type_ in cls.pass_types:
             return type_
 
         new_type = cls.type_map.get(type_, search_sentinel)
@@ -96,51 +120,98 @@ class HDF5Caster(BaseObject):
         return item.hex
 
     @classmethod
-    @singlekwargdispatch("item")
+    def from_datetime_array(cls, item: np.ndarray) -> np.ndarray:
+        """Casts an array of datetimes to an array of timestamps that can be stored in an HDF5."""
+        if item.dtype.kind == "M":
+            return item.astype("datetime64[ns]").astype(np.int64) / 10**9
+        else:
+            timestamps = np.fromiter((i.timestamp() for i in item.flat), dtype=np.float64, count=item.size)
+            return timestamps.reshape(item.shape)
+
+    @classmethod
+    def from_timedelta_array(cls, item: np.ndarray) -> np.ndarray:
+        """Casts an array of timedeltas to an array of seconds that can be stored in an HDF5."""
+        if item.dtype.kind == "m":
+            return item.astype("timedelta64[ns]").astype(np.int64) / 10**9
+        else:
+            return np.fromiter(
+                (i.total_seconds() for i in item.flat), dtype=np.float64, count=item.size
+            ).reshape(item.shape)
+
+    @classmethod
+    def from_array(cls, item: np.ndarray) -> np.ndarray:
+        """Casts an array to a type that can be stored in an HDF5, converting datetime and timedelta arrays at once."""
+        kind = item.dtype.kind
+        if kind == "M":
+            return cls.from_datetime_array(item)
+        elif kind == "m":
+            return cls.from_timedelta_array(item)
+        elif kind == "O" and item.size > 0:
+            first = item.flat[0]
+            if isinstance(first, datetime.datetime):
+                return cls.from_datetime_array(item)
+            elif isinstance(first, datetime.timedelta):
+                return cls.from_timedelta_array(item)
+
+        return item
+
+    @classmethod
+    def from_pass(cls, item: _pass_types) -> _pass_types:
+        """Returns the item because it does not need to cast to another type."""
+        return item
+
+    @classmethod
     def cast_from(cls, item: Any) -> Any:
         """Casts an item to a type that can be stored in an HDF5.
 
+        The cast method is found by the exact type of the item with a single lookup, the isinstance checks are only
+        used for subclasses of the registered types.
+
         Args:
             item: The item to cast a type that can be stored in an HDF5 object.
 
         Returns:
             The item as the new type.
         """
-        return item
+        from_method = cls._from_methods.get(type(item), None)
+        if from_method is None:
+            for type_, method in cls._from_methods.items():
+                if isinstance(item, type_):
+                    from_method = method
+                    break
+            else:
+                return item
 
-    @classmethod
-    @cast_from.__wrapped__.register(str)
-    @cast_from.__wrapped__.register(int)
-    @cast_from.__wrapped__.register(float)
-    @cast_from.__wrapped__.register(np.dtype)
-    @cast_from.__wrapped__.register(h5py.Reference)
-    def _cast_from(cls, item: _pass_types) -> _pass_types:
-        """Returns the item because it does not need to cast to another type."""
-        return item
+        return from_method(item)
 
     @classmethod
-    @cast_from.__wrapped__.register
-    def _cast_from(cls, item: datetime.datetime) -> float:
-        """Casts a datetime to a type that can be stored in an HDF5."""
-        return cls.from_datetime(item)
+    def cast_from_iter(cls, items: Iterable[Any]) -> list[Any]:
+        """Casts all items in an iterable to types that can be stored in an HDF5.
 
-    @classmethod
-    @cast_from.__wrapped__.register
-    def _cast_from(cls, item: datetime.tzinfo) -> float:
-        """Casts a timezone to a type that can be stored in an HDF5."""
-        return cls.from_timezone(item)
+        The cast method is found once from the type of the first item and reused for all items of the same type, so
+        homogeneous iterables only dispatch once.
 
-    @classmethod
-    @cast_from.__wrapped__.register
-    def _cast_from(cls, item: datetime.timedelta) -> float:
-        """Casts a timedelta to a type that can be stored in an HDF5."""
-        return cls.from_timedelta(item)
+        Args:
+            items: The items to cast to types that can be stored in an HDF5 object.
 
-    @classmethod
-    @cast_from.__wrapped__.register
-    def _cast_from(cls, item: uuid.UUID) -> bytes:
-        """Casts a UUID to a type that can be stored in an HDF5."""
-        return cls.from_uuid(item)
+        Returns:
+            The items as the new types.
+        """
+        items = iter(items)
+        first = next(items, search_sentinel)
+        if first is search_sentinel:
+            return []
+
+        first_type = type(first)
+        from_method = cls._from_methods.get(first_type, None)
+        if from_method is None:
+            return [cls.cast_from(first), *(cls.cast_from(item) for item in items)]
+
+        cast_from = cls.cast_from
+        return [
+            from_method(first),
+            *(from_method(item) if type(item) is first_type else cast_from(item) for item in items),
+        ]
 
     # Casting To
 
@@ -186,18 +257,40 @@ class HDF5Caster(BaseObject):
         Returns:
             The python object which the HDF5 represents.
         """
-        to_method = cls.to_registry.get(type_, search_sentinel)
-        if to_method is search_sentinel:
+        to_method = cls._to_methods.get(type_, None)
+        if to_method is None:
             return item
+        elif kwargs:
+            return to_method(item, **kwargs)
         else:
-            return to_method.__get__(cls, cls.__class__)(item, **kwargs)
-
-    to_registry = {
-        int: to_pass,
-        float: to_pass,
-        str: to_str,
-        datetime.datetime: to_datetime,
-        datetime.tzinfo: to_timezone,
-        datetime.timedelta: to_timedelta,
-        uuid.UUID: to_uuid,
-    }
+            return to_method(item)
+
+    from_registry = MappingProxyType(
+        {
+            str: from_pass,
+            int: from_pass,
+            float: from_pass,
+            np.dtype: from_pass,
+            h5py.Reference: from_pass,
+            datetime.datetime: from_datetime,
+            datetime.tzinfo: from_timezone,
+            datetime.timedelta: from_timedelta,
+            uuid.UUID: from_uuid,
+            np.ndarray: from_array,
+        }
+    )
+
+    to_registry = MappingProxyType(
+        {
+            int: to_pass,
+            float: to_pass,
+            str: to_str,
+            datetime.datetime: to_datetime,
+            datetime.tzinfo: to_timezone,
+            datetime.timedelta: to_timedelta,
+            uuid.UUID: to_uuid,
+        }
+    )
+
+
+HDF5Caster.bind_registries()
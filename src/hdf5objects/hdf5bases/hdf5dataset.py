@@ -13,20 +13,30 @@ __email__ = __email__
 
 # Imports #
 # Standard Libraries #
-from collections.abc import Mapping, Iterable
+from collections import ChainMap
+from collections.abc import Mapping, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 import copy
+from functools import partial
 import pathlib
 from typing import Any
 import warnings
 import weakref
+import zlib
 
 # Third-Party Packages #
 from bidict import bidict
-from baseobjects.functions import singlekwargdispatch
+from baseobjects import search_sentinel
 from baseobjects.cachingtools import timed_keyless_cache
+from baseobjects.typing import AnyCallable
 import h5py
 import numpy as np
 
+try:
+    import bitshuffle
+except ImportError:  # bitshuffle is optional, its chunks are decompressed by HDF5 when it is not installed.
+    bitshuffle = None
+
 # Local Packages #
 from .hdf5map import HDF5Map
 from .hdf5baseobject import HDF5BaseObject
@@ -208,7 +218,7 @@ class DatasetMap(HDF5Map):
         Returns:
             The HDF5Object that this map is for.
         """
-        temp_kwargs = self.kwargs | kwargs
+        temp_kwargs = ChainMap(kwargs, self.kwargs)  # Only read, so the kwargs do not need to be merged into a copy.
 
         require = temp_kwargs.get("require", False)
         if require and "data" not in temp_kwargs and ("shape" not in temp_kwargs or "maxshape" not in temp_kwargs):
@@ -286,13 +296,22 @@ class HDF5Dataset(HDF5BaseObject):
             inheritance.
         default_map: The map of this dataset.
         default_axis_map_type: The default axis type when making an axis.
+        bitshuffle_filter: The HDF5 filter id of the bitshuffle filter.
 
     Attributes:
         _dataset: The HDF5 dataset to wrap.
         _scale_name: The name of this dataset if it is a scale.
-        attributes: The attributes of this dataset.
+        _attributes: The attributes of this dataset, None until they are first used.
         _axes: The axes of this dataset.
+        _axes_loaded: Determines if the axes have been loaded from the file.
         axes_kwargs: The keyword arguments used for creating the axes.
+        _memmap: The cached read only memory map of the data, or None if the data cannot be mapped.
+        _append_buffer: The buffered data which has not been appended to the dataset yet.
+        _append_buffer_axis: The axis the buffered data will be appended along.
+        _append_buffer_length: The length of the buffered data along the append axis.
+        _item_casts: The dtypes, casting kwargs, and caster the cached item casting functions were made from.
+        cache_dtype: The dtype to cast all the data to when caching it, or None to keep the dtype of the dataset.
+        chunk_cache: The number of chunks the chunk cache of the dataset holds, or None for the file's chunk cache.
 
     Args:
         data: The data to fill in this dataset.
@@ -308,6 +327,8 @@ class HDF5Dataset(HDF5BaseObject):
         dtype: The dtype of this dataset.
         scale_name: Makes this data an axis with this name.
         casting_kwargs: The keyword arguments for casting HDF5 dtypes to python types.
+        cache_dtype: The dtype to cast all the data to when caching it, reducing its size at a loss of precision.
+        chunk_cache: The number of chunks the chunk cache of the dataset holds, or None for the file's chunk cache.
         component_kwargs: The keyword arguments for creating the components.
         component_types: Component class and their keyword arguments to instantiate.
         components: Components to add.
@@ -319,6 +340,7 @@ class HDF5Dataset(HDF5BaseObject):
     _wrap_attributes: list[str] = ["dataset"]
     # default_map: HDF5Map = DatasetMap()  # This will be assigned after HDF5Dataset is defined
     default_axis_map_type: Any = None
+    bitshuffle_filter: int = 32008
 
     # Magic Methods
     # Constructors/Destructors
@@ -337,6 +359,8 @@ class HDF5Dataset(HDF5BaseObject):
         dtype: np.dtype | str | tuple[tuple[str, type]] | None = None,
         scale_name: str | None = None,
         casting_kwargs: tuple[dict[str, Any]] | None = None,
+        cache_dtype: np.dtype | str | None = None,
+        chunk_cache: int | None = None,
         component_kwargs: dict[str, dict[str, Any]] | None = None,
         component_types: dict[str, tuple[type, dict[str, Any]]] | None = None,
         components: dict[str, Any] | None = None,
@@ -346,10 +370,18 @@ class HDF5Dataset(HDF5BaseObject):
         # New Attributes #
         self._dataset: h5py.Dataset | None = None
         self._scale_name: str | None = None
-        self.attributes: HDF5Attributes | None = None
+        self._attributes: HDF5Attributes | None = None
 
         self._axes: list[dict[str, Any]] = []
+        self._axes_loaded: bool = False
         self.axes_kwargs: Iterable[dict[str, dict[str, Any]]] = []
+        self._memmap: np.memmap | None | Any = search_sentinel
+        self._append_buffer: list[np.ndarray] = []
+        self._append_buffer_axis: int = 0
+        self._append_buffer_length: int = 0
+        self._item_casts: tuple[Any, Any, Any, tuple[tuple[str, AnyCallable], ...]] | None = None
+        self.cache_dtype: np.dtype | None = None
+        self.chunk_cache: int | None = None
 
         # Parent Attributes #
         super().__init__(init=False)
@@ -370,6 +402,8 @@ class HDF5Dataset(HDF5BaseObject):
                 dtype=dtype,
                 scale_name=scale_name,
                 casting_kwargs=casting_kwargs,
+                cache_dtype=cache_dtype,
+                chunk_cache=chunk_cache,
                 component_kwargs=component_kwargs,
                 component_types=component_types,
                 components=components,
@@ -399,6 +433,17 @@ class HDF5Dataset(HDF5BaseObject):
     def casting_kwargs(self, value: list[dict[str, Any]]) -> None:
         self.map.casting_kwargs = value
 
+    @property
+    def attributes(self) -> HDF5Attributes:
+        """The attributes of this dataset, which are constructed the first time they are used."""
+        if self._attributes is None:
+            self.construct_attributes()
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, value: HDF5Attributes | None) -> None:
+        self._attributes = value
+
     @property
     def scale_name(self) -> str:
         """The name of this dataset if it is a scale. The setter applies the scale name in the HDF5 file."""
@@ -416,6 +461,22 @@ class HDF5Dataset(HDF5BaseObject):
         except AttributeError:
             return self.get_shape()
 
+    @property
+    def meta(self) -> dict[str, Any]:
+        """The shape, dtype, chunks, maximum shape, and number of dimensions of the dataset, caching the output."""
+        try:
+            return self.get_meta.caching_call()
+        except AttributeError:
+            return self.get_meta()
+
+    @property
+    def chunk_infos(self) -> list[Any]:
+        """The storage information of every stored chunk in the dataset, caching the output."""
+        try:
+            return self.get_chunk_infos.caching_call()
+        except AttributeError:
+            return self.get_chunk_infos()
+
     @property
     def axes(self) -> list[dict[str, Any]]:
         """The axes of this dataset."""
@@ -431,9 +492,11 @@ class HDF5Dataset(HDF5BaseObject):
         except AttributeError:
             return self.get_all_data()
 
-    def __array__(self, dtype: np.dtype | None = None) -> np.ndarray:
-        """Return this dataset as a numpy array."""
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> np.ndarray:
+        """Return this dataset as a numpy array, which is always a new array read from the file."""
         with self:
+            if dtype is None or np.dtype(dtype) == self.meta["dtype"]:
+                return self.read_all_data()
             return self._dataset.__array__(dtype=dtype)
 
     # Pickling
@@ -443,8 +506,13 @@ class HDF5Dataset(HDF5BaseObject):
         Returns:
             dict: A dictionary of this object's attributes.
         """
+        self.flush_append_buffer()  # The buffered data belongs to the file, so it is written rather than pickled.
         state = super().__getstate__()
         state["_dataset"] = None
+        state["_memmap"] = None
+        state["_append_buffer"] = []
+        state["_append_buffer_length"] = 0
+        state["_item_casts"] = None
         return state
 
     def __setstate__(self, state: Mapping[str, Any]) -> None:
@@ -454,19 +522,43 @@ class HDF5Dataset(HDF5BaseObject):
             state: The attributes to build this object from.
         """
         super().__setstate__(state=state)
+        self._memmap = search_sentinel
         with self.file.temp_open:
             self._dataset = self.file._file[self._full_name]
 
     # Container Methods
     def __getitem__(self, key: Any) -> Any:
         """Ensures HDF5 object is open for getitem"""
+        if self._is_held_open():  # Already open, so the open and close of the context can be skipped.
+            return self.get_item(key=key)
         with self:
             return self.get_item(key=key)
 
     def __setitem__(self, key: Any, value: Any) -> None:
         """Ensures HDF5 object is open for setitem"""
-        with self:
+        if self._is_held_open():  # Already open, so the open and close of the context can be skipped.
             self.set_item(key, value)
+        else:
+            with self:
+                self.set_item(key, value)
+
+    def __contains__(self, item: Any) -> bool:
+        """Checks if an item is a row of the dataset, reading the data in blocks rather than all at once."""
+        with self:
+            shape = self._dataset.shape
+            if not shape:
+                return bool(self._dataset[()] == item)
+
+            item = np.asarray(item)
+            try:
+                np.broadcast_shapes(item.shape, shape[1:])
+            except ValueError:
+                return False
+            row_axes = tuple(range(1, len(shape)))
+            for _, block in self.iter_blocks():
+                if (block == item).all(axis=row_axes).any():
+                    return True
+            return False
 
     # Instance Methods
     # Constructors/Destructors
@@ -485,6 +577,8 @@ class HDF5Dataset(HDF5BaseObject):
         dtype: np.dtype | str | tuple[tuple[str, type]] | None = None,
         scale_name: str | None = None,
         casting_kwargs: tuple[dict[str, Any]] | None = None,
+        cache_dtype: np.dtype | str | None = None,
+        chunk_cache: int | None = None,
         component_kwargs: dict[str, dict[str, Any]] | None = None,
         component_types: dict[str, tuple[type, dict[str, Any]]] | None = None,
         components: dict[str, Any] | None = None,
@@ -506,6 +600,8 @@ class HDF5Dataset(HDF5BaseObject):
             dtype: The dtype of this dataset.
             scale_name: Makes this data an axis with this name.
             casting_kwargs: The keyword arguments for casting HDF5 dtypes to python types.
+            cache_dtype: The dtype to cast all the data to when caching it, reducing its size at a loss of precision.
+            chunk_cache: The number of chunks the chunk cache of the dataset holds, or None for the file's chunk cache.
             component_kwargs: The keyword arguments for creating the components.
             component_types: Component class and their keyword arguments to instantiate.
             components: Components to add.
@@ -524,11 +620,13 @@ class HDF5Dataset(HDF5BaseObject):
             self.set_parent(parent=parent)
         elif map_ is not None:
             self._parents = self.map.parents
+            self._full_name_cache = None
 
         if name is not None:
             self.set_name(name=name)
         elif map_ is not None:
             self._name_ = self.map.name
+            self._full_name_cache = None
 
         if mode is not None:
             self.set_mode(mode)
@@ -541,6 +639,12 @@ class HDF5Dataset(HDF5BaseObject):
         if dtype is not None:
             self.map.set_dtype(dtype)
 
+        if cache_dtype is not None:
+            self.cache_dtype = np.dtype(cache_dtype)
+
+        if chunk_cache is not None:
+            self.chunk_cache = chunk_cache
+
         if dataset is not None:
             self.set_dataset(dataset)
 
@@ -550,7 +654,7 @@ class HDF5Dataset(HDF5BaseObject):
         if scale_name is not None:
             self._scale_name = scale_name
 
-        self.construct_attributes()
+        self._attributes = None  # The attributes are built when they are first used.
 
         super().construct(
             component_kwargs=component_kwargs,
@@ -580,26 +684,59 @@ class HDF5Dataset(HDF5BaseObject):
         )
 
     # File
+    def open(self, mode: str = "a", **kwargs: Any) -> "HDF5Dataset":
+        """Opens the file to make this dataset usable, loading the dataset with its chunk cache when it is not loaded.
+
+        Args:
+            mode: The file mode to open the file with.
+            **kwargs: The additional keyword arguments to open the file with.
+
+        Returns:
+            This object.
+        """
+        loading = not self._open_depth and not self._dataset
+        super().open(mode=mode, **kwargs)
+        if loading and self.chunk_cache is not None:
+            self._dataset = self.apply_chunk_cache(self._dataset)
+        return self
+
+    def close(self) -> None:
+        """Closes the file of this dataset once the outermost context exits, appending any buffered data first."""
+        if self._open_depth <= 1 and not self._file_was_open and self._append_buffer:
+            self.flush_append_buffer()
+        super().close()
+
     def load_axes(self) -> None:
-        """Loads the axes from file."""
+        """Loads the axes from file, which is skipped if they are loaded and the file cannot be changed."""
+        if self._axes_loaded and self._mode_ not in self.write_modes and not self.file.swmr_mode:
+            return
+
         with self:
+            dataset = self._dataset
             if self.file.swmr_mode:
-                self._dataset.refresh()
-            if len(self._dataset.dims) > len(self._axes):
-                self._axes.extend([{} for i in range(len(self._dataset.dims) - len(self._axes))])
-
-            mapped_dims = len(self.map.axis_maps)
-            for i, dim in enumerate(self._dataset.dims):
-                mapped_axes = self.map.axis_maps[i] if i < mapped_dims else {}
+                dataset.refresh()
+
+            dims = dataset.dims
+            axes = self._axes
+            n_dims = len(dims)
+            if n_dims > len(axes):
+                axes.extend([{} for i in range(n_dims - len(axes))])
+
+            axis_maps = self.map.axis_maps
+            mapped_dims = len(axis_maps)
+            for i, dim in enumerate(dims):
+                mapped_axes = axis_maps[i] if i < mapped_dims else {}
                 all_names = set(dim.keys())
-                missing_names = all_names - set(self._axes[i].keys())
+                missing_names = all_names - set(axes[i].keys())
                 missing_maps = set(mapped_axes.keys()) - all_names
                 if missing_maps and False:  # Todo: Set verbose because this does not need to always warn.
                     warnings.warn(f"A dataset's axis {missing_maps} is missing.")
 
                 for name in missing_names:
                     axis_map = mapped_axes.get(name, self.default_axis_map_type())
-                    self._axes[i][name] = axis_map.get_object(dataset=dim[name], scale_name=name, file=self.file)
+                    axes[i][name] = axis_map.get_object(dataset=dim[name], scale_name=name, file=self.file)
+
+        self._axes_loaded = True
 
     def load(self) -> None:
         """Loads this dataset which is just loading the attributes."""
@@ -610,12 +747,17 @@ class HDF5Dataset(HDF5BaseObject):
         """Reloads the dataset and attributes."""
         with self:
             self._dataset.refresh()
+        self._axes_loaded = False
         self.attributes.refresh()
-        self.get_shape.clear_cache()
-        self.get_all_data.clear_cache()
+        self._memmap = search_sentinel
+        self.clear_caches()
         for dim in self.axes:
             for axis in dim.values():
                 axis.refresh()
+        for component in self.components.values():
+            refresh = getattr(component, "refresh", None)
+            if refresh is not None:
+                refresh()
 
     # Caching
     def clear_all_caches(self, **kwargs: Any) -> None:
@@ -696,6 +838,38 @@ class HDF5Dataset(HDF5BaseObject):
                 axis.set_all_lifetimes(lifetime=lifetime, **kwargs)
 
     # Item Data Types
+    def get_item_casts(
+        self,
+        casting_kwargs: list[dict[str | Any]] | None = None,
+    ) -> tuple[tuple[str, AnyCallable], ...]:
+        """Gets the name and casting function of each field of the dataset's type.
+
+        The functions for the dataset's own casting kwargs are cached until the dtypes, casting kwargs, or caster
+        change.
+
+        Args:
+            casting_kwargs: The keyword arguments for casting HDF5 dtypes to python types.
+
+        Returns:
+            The name and casting function of each field.
+        """
+        dtypes = self.dtypes
+        caster = self.caster
+        own_kwargs = casting_kwargs is None
+        if own_kwargs:
+            casting_kwargs = self.casting_kwargs
+            cached = self._item_casts
+            if cached is not None and cached[0] is dtypes and cached[1] is casting_kwargs and cached[2] is caster:
+                return cached[3]
+
+        cast_to = caster.cast_to
+        casts = tuple(
+            (name, partial(cast_to, type_, **kwargs)) for (name, type_), kwargs in zip(dtypes, casting_kwargs)
+        )
+        if own_kwargs:
+            self._item_casts = (dtypes, casting_kwargs, caster, casts)
+        return casts
+
     def item_to_dict(self, item: Any, casting_kwargs: list[dict[str | Any]] | None = None) -> dict:
         """Translates an item of the dataset's type to a dictionary that multi-type.
 
@@ -709,11 +883,7 @@ class HDF5Dataset(HDF5BaseObject):
         if isinstance(item, np.ndarray):
             item = item[0]
 
-        if casting_kwargs is None:
-            casting_kwargs = self.casting_kwargs
-
-        types = zip(self.dtypes, casting_kwargs)
-        return {name: self.caster.cast_to(type_, item[i], **kwargs) for i, ((name, type_), kwargs) in enumerate(types)}
+        return {name: cast(item[i]) for i, (name, cast) in enumerate(self.get_item_casts(casting_kwargs))}
 
     def dict_to_item(self, dict_: dict) -> Any:
         """Translates a dictionary of a multi-type to an item that can be added to the dataset.
@@ -751,14 +921,14 @@ class HDF5Dataset(HDF5BaseObject):
             The item or items requested.
         """
         if self.file.swmr_mode:
-            ds = getattr(self, self._wrap_attributes[0])
+            ds = self._dataset
             ds.refresh()
             try:
                 return ds[key]
             except OSError:
                 return ds[...][key]  # This is very slow but sometimes indexing breaks when in SWMR
         else:
-            return getattr(self, self._wrap_attributes[0])[key]
+            return self._dataset[key]
 
     def get_item_dict(self, index: int | tuple | h5py.Reference) -> dict:
         """Gets an item from the given an index and translates a multi-type into a dictionary.
@@ -771,20 +941,32 @@ class HDF5Dataset(HDF5BaseObject):
         """
         return self.item_to_dict(self[index])
 
+    def get_item_dicts(self, key: Any, casting_kwargs: list[dict[str | Any]] | None = None) -> list[dict]:
+        """Gets items from the given key and translates them into dictionaries with one read.
+
+        The items are translated field by field, so the cast method of each field is only resolved once.
+
+        Args:
+            key: The key to get the items with.
+            casting_kwargs: The keyword arguments for casting HDF5 dtypes to python types.
+
+        Returns:
+            The items of interest as dictionaries.
+        """
+        items = np.atleast_1d(self[key])
+        casts = self.get_item_casts(casting_kwargs)
+        names = [name for name, _ in casts]
+        fields = ([cast(value) for value in items[name]] for name, cast in casts)
+        return [dict(zip(names, values)) for values in zip(*fields)]
+
     def get_item_dicts_iter(self, casting_kwargs: list[dict[str | Any]] | None = None) -> Iterable:
         """Gets the item dictionaries as an iterable.
 
         Args:
             casting_kwargs: The keyword arguments for casting HDF5 dtypes to python types.
         """
-        if casting_kwargs is None:
-            casting_kwargs = self.casting_kwargs
-
-        types = tuple(zip(self.dtypes, casting_kwargs))
-        return (
-            {name: self.caster.cast_to(type_, item[i], **kwargs) for i, ((name, type_), kwargs) in enumerate(types)}
-            for item in self[...]
-        )
+        casts = self.get_item_casts(casting_kwargs)
+        return ({name: cast(item[i]) for i, (name, cast) in enumerate(casts)} for item in self[...])
 
     def set_item(self, key: Any, value: Any) -> None:
         """Sets an item or items from the dataset.
@@ -793,7 +975,7 @@ class HDF5Dataset(HDF5BaseObject):
             key: The key to set an item or items from the dataset.
             value: The value or values to set in the dataset.
         """
-        getattr(self, self._wrap_attributes[0])[key] = value
+        self._dataset[key] = value
         self.clear_all_caches()
 
     def set_item_dict(self, index: int | tuple | h5py.Reference, dict_: dict) -> None:
@@ -806,14 +988,20 @@ class HDF5Dataset(HDF5BaseObject):
         self[index] = self.dict_to_item(self.get_item_dict(index) | dict_)
         self.clear_all_caches()
 
-    @singlekwargdispatch("dataset")
-    def set_dataset(self, dataset: "HDF5Dataset") -> None:
+    def set_dataset(self, dataset: "HDF5Dataset | h5py.Dataset") -> None:
         """Sets the wrapped dataset.
 
         Args:
             dataset: The dataset this object will wrap.
         """
-        if isinstance(dataset, HDF5Dataset):
+        if isinstance(dataset, h5py.Dataset):
+            if not dataset:
+                raise ValueError("Dataset needs to be open")
+            if self.file is None:
+                self.set_file(dataset.file)
+            self.set_name(dataset.name)
+            self._dataset = self.apply_chunk_cache(dataset, owned=False)
+        elif isinstance(dataset, HDF5Dataset):
             if self.file is None:
                 self.set_file(dataset.file)
             self.set_name(dataset._name)
@@ -821,19 +1009,38 @@ class HDF5Dataset(HDF5BaseObject):
         else:
             raise TypeError(f"{type(dataset)} is not a valid type for set_dataset.")
 
-    @set_dataset.register
-    def _(self, dataset: h5py.Dataset) -> None:
-        """Sets the wrapped dataset.
+    def apply_chunk_cache(self, dataset: h5py.Dataset, owned: bool = True) -> h5py.Dataset:
+        """Reopens a chunked dataset with a chunk cache large enough to hold the chunk_cache number of chunks.
+
+        The chunk cache is never made smaller than the file's chunk cache, and its number of slots is a prime of about
+        one hundred times the number of chunks, as HDF5 recommends. HDF5 shares the chunk cache between all open
+        handles of a dataset, so the new chunk cache only takes effect when no other handle of the dataset is open.
 
         Args:
-            dataset: The dataset this object will wrap.
+            dataset: The dataset to reopen.
+            owned: Determines if the given handle of the dataset is closed before the dataset is reopened.
+
+        Returns:
+            The dataset with the chunk cache, or the same dataset if it is not chunked or no chunk cache is set.
         """
-        if not dataset:
-            raise ValueError("Dataset needs to be open")
-        if self.file is None:
-            self.set_file(dataset.file)
-        self.set_name(dataset.name)
-        self._dataset = dataset
+        n_chunks = self.chunk_cache
+        chunks = dataset.chunks
+        if n_chunks is None or chunks is None or dataset.name is None:
+            return dataset
+
+        access_plist = dataset.id.get_access_plist()
+        n_slots, n_bytes, w0 = access_plist.get_chunk_cache()
+        n_bytes = max(n_bytes, int(np.prod(chunks)) * dataset.dtype.itemsize * n_chunks)
+        n_slots = max(n_slots, 100 * n_chunks + 1)
+        while n_slots % 2 == 0 or any(n_slots % i == 0 for i in range(3, int(n_slots**0.5) + 1, 2)):
+            n_slots += 1
+        access_plist.set_chunk_cache(n_slots, n_bytes, w0)
+
+        file_id = dataset.file.id
+        name = dataset.name.encode()
+        if owned:
+            dataset.id.close()
+        return h5py.Dataset(h5py.h5d.open(file_id, name, dapl=access_plist))
 
     @timed_keyless_cache(lifetime=1.0, call_method="clearing_call", local=True)
     def get_shape(self) -> tuple[int]:
@@ -842,14 +1049,37 @@ class HDF5Dataset(HDF5BaseObject):
         Returns:
             The shape of the dataset.
         """
+        dataset = self._dataset
+        if not dataset:  # The file only needs to be opened when the dataset is not valid.
+            with self:
+                return self.get_shape()
+
+        if self.file.swmr_mode:
+            dataset.refresh()
+        return dataset.shape
+
+    @timed_keyless_cache(lifetime=1.0, call_method="clearing_call", local=True)
+    def get_meta(self) -> dict[str, Any]:
+        """Gets the shape, dtype, chunks, maximum shape, and number of dimensions of the dataset in one visit.
+
+        Returns:
+            The metadata of the dataset.
+        """
         with self:
+            dataset = self._dataset
             if self.file.swmr_mode:
-                self._dataset.refresh()
-            return self._dataset.shape
+                dataset.refresh()
+            return {
+                "shape": dataset.shape,
+                "dtype": dataset.dtype,
+                "chunks": dataset.chunks,
+                "maxshape": dataset.maxshape,
+                "ndim": dataset.ndim,
+            }
 
     @timed_keyless_cache(lifetime=1.0, call_method="clearing_call", local=True)
     def get_all_data(self) -> np.ndarray:
-        """Gets all the data in the dataset.
+        """Gets all the data in the dataset, cast to the cache dtype when one is set and the cast is safe in kind.
 
         Returns:
             All the data in the dataset.
@@ -857,7 +1087,179 @@ class HDF5Dataset(HDF5BaseObject):
         with self:
             if self.file.swmr_mode:
                 self._dataset.refresh()
-            return self._dataset[...]
+            data = self.read_all_data()
+
+        cache_dtype = self.cache_dtype
+        if cache_dtype is not None and np.can_cast(data.dtype, cache_dtype, casting="same_kind"):
+            data = data.astype(cache_dtype, copy=False)
+        return data
+
+    def read_all_data(self, out: np.ndarray | None = None) -> np.ndarray:
+        """Reads all the data in the dataset directly into an array without an intermediate copy.
+
+        Args:
+            out: The array to read the data into, a new array is made when not given.
+
+        Returns:
+            The array with all the data in the dataset.
+        """
+        with self:
+            dataset = self._dataset
+            if dataset.dtype.hasobject:  # Variable length types are converted by h5py while reading.
+                if out is None:
+                    return dataset[...]
+                out[...] = dataset[...]
+                return out
+
+            if out is None:
+                out = np.empty(dataset.shape, dtype=dataset.dtype)
+            if out.size:
+                dataset.read_direct(out)
+            return out
+
+    def read_all_data_parallel(self, n_workers: int | None = None) -> np.ndarray:
+        """Reads all the data in a compressed dataset, decompressing its chunks in parallel threads.
+
+        HDF5 decompresses chunks one at a time, but zlib and bitshuffle release the GIL, so the raw chunks are read
+        directly and decompressed in worker threads. Bitshuffle chunks are only decompressed here when the bitshuffle
+        package is installed. Datasets which are not chunked and compressed with only one of these filters are read
+        with read_all_data.
+
+        Args:
+            n_workers: The number of threads to decompress the chunks with, the executor's default when not given.
+
+        Returns:
+            The array with all the data in the dataset.
+        """
+        with self:
+            dataset = self._dataset
+            create_plist = dataset.id.get_create_plist()
+            filters = [create_plist.get_filter(i) for i in range(create_plist.get_nfilters())]
+            if dataset.chunks is None or dataset.dtype.hasobject or len(filters) != 1:
+                return self.read_all_data()
+
+            shape = dataset.shape
+            chunks = dataset.chunks
+            dtype = dataset.dtype
+            chunk_size = int(np.prod(chunks))
+            filter_id, _, filter_options, _ = filters[0]
+            if filter_id == h5py.h5z.FILTER_DEFLATE:
+
+                def decompress(raw: bytes) -> np.ndarray:
+                    return np.frombuffer(zlib.decompress(raw), dtype=dtype)
+
+            elif filter_id == self.bitshuffle_filter and bitshuffle is not None:
+                compression = filter_options[4] if len(filter_options) > 4 else 0
+                if compression == 0:
+                    block_size = filter_options[3] if len(filter_options) > 3 else 0
+
+                    def decompress(raw: bytes) -> np.ndarray:
+                        return bitshuffle.bitunshuffle(np.frombuffer(raw, dtype=dtype), block_size)
+
+                else:
+                    decompress_blocks = bitshuffle.decompress_lz4 if compression == 2 else bitshuffle.decompress_zstd
+
+                    def decompress(raw: bytes) -> np.ndarray:
+                        # The chunk starts with its uncompressed size and its block size in bytes, both big endian.
+                        block_size = int.from_bytes(raw[8:12], "big") // dtype.itemsize
+                        blocks = np.frombuffer(raw, dtype=np.uint8, offset=12)
+                        return decompress_blocks(blocks, (chunk_size,), dtype, block_size)
+
+            else:
+                return self.read_all_data()
+
+            read_chunk = dataset.id.read_direct_chunk
+            out = np.full(shape, dataset.fillvalue, dtype=dtype)
+
+            def read_into_out(info: Any) -> None:
+                filter_mask, raw = read_chunk(info.chunk_offset)
+                chunk = (np.frombuffer(raw, dtype=dtype) if filter_mask & 1 else decompress(raw)).reshape(chunks)
+                selection = tuple(slice(o, min(o + c, n)) for o, c, n in zip(info.chunk_offset, chunks, shape))
+                out[selection] = chunk[tuple(slice(0, s.stop - s.start) for s in selection)]
+
+            with ThreadPoolExecutor(n_workers) as executor:
+                for _ in executor.map(read_into_out, self.get_chunk_infos()):
+                    pass
+            return out
+
+    def iter_blocks(self, axis: int = 0, block_size: int | None = None) -> Iterator[tuple[int, np.ndarray]]:
+        """Iterates over blocks of the data along an axis, reading each block directly into one reused array.
+
+        The array is overwritten by the next block, so a block must be copied to keep it past its iteration.
+
+        Args:
+            axis: The axis to split the data into blocks along.
+            block_size: The length of the blocks along the axis, the chunk length or whole axis when not given.
+
+        Yields:
+            The start index of the block along the axis and the data of the block.
+        """
+        with self:
+            dataset = self._dataset
+            shape = dataset.shape
+            length = shape[axis]
+            chunks = dataset.chunks
+            if block_size is None:
+                block_size = chunks[axis] if chunks is not None else length
+            block_size = max(1, min(block_size, length))
+
+            selection = [slice(None)] * len(shape)
+            if dataset.dtype.hasobject:  # Variable length types are converted by h5py while reading.
+                for start in range(0, length, block_size):
+                    selection[axis] = slice(start, start + block_size)
+                    yield start, dataset[tuple(selection)]
+                return
+
+            block_shape = list(shape)
+            block_shape[axis] = block_size
+            block = np.empty(block_shape, dtype=dataset.dtype)
+            block_selection = [slice(None)] * len(shape)
+            for start in range(0, length, block_size):
+                stop = min(start + block_size, length)
+                selection[axis] = slice(start, stop)
+                block_selection[axis] = slice(0, stop - start)
+                block_view = block[tuple(block_selection)]
+                if block_view.size:
+                    dataset.read_direct(block, source_sel=tuple(selection), dest_sel=tuple(block_selection))
+                yield start, block_view
+
+    def get_memmap(self) -> np.memmap | None:
+        """Gets a read only memory map of the data when it is stored contiguously and uncompressed in the file.
+
+        The map is only made for files opened read only, so it never misses writes which have not been flushed. The map
+        is opened separately from the HDF5 file and outlives it: it stays usable after the file is closed, but if the
+        file is rewritten or truncated while the map or any view of it is still in use, reading it can crash the
+        interpreter with SIGBUS. Copy the data out of the map when it must outlive the file, and delete the map and
+        its views before changing the file. The default reads never return the map.
+
+        Returns:
+            The memory map of the data or None if the data cannot be mapped.
+        """
+        with self:
+            dataset = self._dataset
+            if dataset.file.mode != "r":
+                return None
+
+            if self._memmap is search_sentinel:
+                offset = dataset.id.get_offset()
+                if (
+                    offset is None
+                    or dataset.size == 0
+                    or dataset.chunks is not None
+                    or dataset.external is not None
+                    or dataset.dtype.kind not in "biufc"
+                    or dataset.file.driver not in {"sec2", "stdio"}
+                ):
+                    self._memmap = None
+                else:
+                    self._memmap = np.memmap(
+                        dataset.file.filename,
+                        dtype=dataset.dtype,
+                        mode="r",
+                        offset=offset,
+                        shape=dataset.shape,
+                    )
+        return self._memmap
 
     def get_field(self, name: str) -> np.ndarray:
         """Gets all the data of a dtype field in the dataset.
@@ -870,7 +1272,104 @@ class HDF5Dataset(HDF5BaseObject):
                 self._dataset.refresh()
             return self._dataset[name]
 
+    @timed_keyless_cache(lifetime=1.0, call_method="clearing_call", local=True)
+    def get_chunk_infos(self) -> list[Any]:
+        """Gets the storage information of every stored chunk in the dataset.
+
+        HDF5's chunk iteration visits all chunks in one pass, where looking up each chunk by its index is quadratic
+        in the number of chunks, so the lookup by index is only used when the chunk iteration is unavailable.
+
+        Returns:
+            The storage information of the stored chunks.
+        """
+        with self:
+            dataset_id = self._dataset.id
+            if self.meta["chunks"] is None:
+                return []
+            elif hasattr(dataset_id, "chunk_iter"):
+                infos = []
+                dataset_id.chunk_iter(infos.append)
+                return infos
+            else:
+                warnings.warn(
+                    "Chunk iteration is unavailable, upgrade to h5py 3.8 and HDF5 1.12.3 or later for faster chunk "
+                    "lookups.",
+                    stacklevel=2,
+                )
+                return [dataset_id.get_chunk_info(i) for i in range(dataset_id.get_num_chunks())]
+
     # Data Modification
+    @staticmethod
+    def get_auto_chunks(
+        shape: tuple[int, ...],
+        maxshape: tuple[int | None, ...],
+        dtype: np.dtype,
+        access_axis: int = 0,
+        target_nbytes: int = 1 << 20,
+        min_length: int = 64,
+    ) -> tuple[int, ...]:
+        """Gets a chunk shape for a resizable dataset which is close to but no larger than the target size.
+
+        The other axes are filled first, from the last axis outward, so a chunk holds whole rows across them, then the
+        access axis takes the rest of the target size, clamped to the length of the data along it.
+
+        Args:
+            shape: The shape of the dataset.
+            maxshape: The maximum shape of the dataset, where None is unlimited.
+            dtype: The dtype of the dataset.
+            access_axis: The axis which the dataset is mostly read and appended along.
+            target_nbytes: The number of bytes each chunk should be close to, the default HDF5 chunk cache size.
+            min_length: The smallest length along the access axis, so short data still has room to be appended to.
+
+        Returns:
+            The shape of the chunks.
+        """
+        ndim = len(shape)
+        remaining = max(1, target_nbytes // max(1, dtype.itemsize))
+        chunks = [1] * ndim
+        for axis in reversed(range(ndim)):
+            if axis != access_axis:
+                size = max(shape[axis], 1) if maxshape[axis] is None else max(maxshape[axis], 1)
+                chunks[axis] = min(size, remaining)
+                remaining = max(1, remaining // chunks[axis])
+
+        length = min(remaining, max(shape[access_axis], min_length))
+        access_max = maxshape[access_axis]
+        chunks[access_axis] = length if access_max is None else max(1, min(access_max, length))
+        return tuple(chunks)
+
+    def set_auto_chunks(self, kwargs: dict[str, Any], access_axis: int = 0, target_nbytes: int = 1 << 20) -> None:
+        """Adds a chunk shape to the create kwargs of a resizable dataset when no chunk shape was given.
+
+        Datasets smaller than one chunk keep the chunk shape h5py guesses, which is sized to the data.
+
+        Args:
+            kwargs: The keyword arguments for creating the dataset, which are modified in place.
+            access_axis: The axis which the dataset is mostly read and appended along.
+            target_nbytes: The number of bytes each chunk should be close to.
+        """
+        shape = kwargs.get("shape", None)
+        maxshape = kwargs.get("maxshape", None)
+        if "chunks" in kwargs or shape is None or maxshape is None or not shape or tuple(maxshape) == tuple(shape):
+            return
+
+        data = kwargs.get("data", None)
+        try:
+            dtype = np.dtype(data.dtype if data is not None else kwargs.get("dtype", None))
+        except TypeError:
+            return
+
+        if int(np.prod(shape)) * dtype.itemsize < target_nbytes:
+            return
+
+        kwargs["chunks"] = self.get_auto_chunks(
+            tuple(shape),
+            tuple(maxshape),
+            dtype,
+            access_axis=access_axis,
+            target_nbytes=target_nbytes,
+        )
+
     def create_data(self, name: str | None = None, **kwargs: Any) -> None:
         """Creates and fills the data, gives an error if it already exists.
 
@@ -884,14 +1383,15 @@ class HDF5Dataset(HDF5BaseObject):
         if name is not None:
             self._name = name
 
-        if "data" in kwargs:
-            if "shape" not in kwargs:
-                kwargs["shape"] = kwargs["data"].shape
-            if "maxshape" not in kwargs:
-                kwargs["maxshape"] = kwargs["data"].shape
+        data = kwargs.get("data", None)
+        if data is not None:
+            shape = data.shape
+            kwargs.setdefault("shape", shape)
+            kwargs.setdefault("maxshape", shape)
+        self.set_auto_chunks(kwargs)
 
         with self.file.temp_open():
-            self._dataset = self.file._file.create_dataset(name=self._full_name, **kwargs)
+            self._dataset = self.apply_chunk_cache(self.file._file.create_dataset(name=self._full_name, **kwargs))
             if self.file._file.swmr_mode:
                 if self.file.allow_swmr_create:
                     self.file.close()
@@ -902,6 +1402,7 @@ class HDF5Dataset(HDF5BaseObject):
             self.attributes.construct_attributes()
             if self._scale_name is not None:
                 self._dataset.make_scale(self._scale_name)
+            self.clear_caches()
 
     def create_axis(self, dim: int, scale_name: str, **kwargs: Any) -> "HDF5Dataset":
         """Creates and fills an axis for this dataset, gives an error if any already exists.
@@ -914,10 +1415,10 @@ class HDF5Dataset(HDF5BaseObject):
         if len(self.axes) < dim + 1:
             self.axes.extend([{}] * (dim + 1 - len(self.axes)))
 
-        old_kwargs = self.axes_kwargs[dim].get(scale_name, {}) if i < len(self.axes_kwargs) else {}
+        old_kwargs = self.axes_kwargs[dim].get(scale_name, {}) if dim < len(self.axes_kwargs) else {}
         temp_kwargs = {
             "name": f"{self._full_name}_{scale_name}",
-            "scale_name": name,
+            "scale_name": scale_name,
             "require": True,
             "file": self.file,
         }
@@ -925,8 +1426,8 @@ class HDF5Dataset(HDF5BaseObject):
             temp_kwargs["size"] = self.shape[dim]
         new_kwargs = temp_kwargs | old_kwargs | kwargs
 
-        self.axes[i][name] = axis = self.map.axis_maps[dim][scale_name].create_object(**new_kwargs)
-        self._dataset.dims[i].attach_scale(axis._dataset)
+        self.axes[dim][scale_name] = axis = self.map.axis_maps[dim][scale_name].create_object(**new_kwargs)
+        self._dataset.dims[dim].attach_scale(axis._dataset)
         return axis
 
     def create_axes(self, axes_kwargs: Iterable[dict[str, dict[str, Any]]] = ()) -> None:
@@ -938,6 +1439,8 @@ class HDF5Dataset(HDF5BaseObject):
         if len(self.axes) < len(self.map.axis_maps):
             self.axes.extend([{} for i in range(len(self.map.axis_maps) - len(self.axes))])
 
+        full_name = self._full_name
+        shape = self.shape if self.exists else None
         temp_kwargs = {"require": True, "file": self.file}
         new_kwargs_len = len(axes_kwargs)
         old_kwargs_len = len(self.axes_kwargs)
@@ -945,10 +1448,10 @@ class HDF5Dataset(HDF5BaseObject):
             for name, axis_map in dim.items():
                 new_kwargs = axes_kwargs[i].get(name, {}) if i < new_kwargs_len else {}
                 old_kwargs = self.axes_kwargs[i].get(name, {}) if i < old_kwargs_len else {}
-                temp_kwargs["name"] = f"{self._full_name}_{name}"
+                temp_kwargs["name"] = f"{full_name}_{name}"
                 temp_kwargs["scale_name"] = name
-                if "data" not in new_kwargs and "data" not in old_kwargs and self.exists:
-                    temp_kwargs["component_kwargs"] = {"axis": {"size": self.shape[i]}}
+                if shape is not None and "data" not in new_kwargs and "data" not in old_kwargs:
+                    temp_kwargs["component_kwargs"] = {"axis": {"size": shape[i]}}
                 kwargs = temp_kwargs | old_kwargs | new_kwargs
                 self.axes[i][name] = axis = axis_map.create_object(**kwargs)
                 self._dataset.dims[i].attach_scale(axis._dataset)
@@ -989,13 +1492,17 @@ class HDF5Dataset(HDF5BaseObject):
         if name is not None:
             self._name = name
 
-        if "data" in kwargs and kwargs["data"] is not None:
-            kwargs["shape"] = kwargs["data"].shape
+        data = kwargs.get("data", None)
+        if data is not None:
+            kwargs["shape"] = data.shape
 
         with self.file.temp_open():
             if not self.exists:
                 self.kwargs.update(kwargs)
-                self._dataset = self.file._file.create_dataset(name=self._full_name, **self.kwargs)
+                self.set_auto_chunks(self.kwargs)
+                self._dataset = self.apply_chunk_cache(
+                    self.file._file.create_dataset(name=self._full_name, **self.kwargs)
+                )
                 if self.file._file.swmr_mode:
                     if self.file.allow_swmr_create:
                         self.file.close()
@@ -1006,9 +1513,9 @@ class HDF5Dataset(HDF5BaseObject):
                 self.attributes.construct_attributes()
                 if self._scale_name is not None:
                     self._dataset.make_scale(self._scale_name)
+                self.clear_caches()
             else:
-                self._dataset = self.file._file[self._full_name]
-                data = kwargs.get("data", None)
+                self._dataset = self.apply_chunk_cache(self.file._file[self._full_name])
                 if data is not None:
                     self.replace_data(data=data)
 
@@ -1053,6 +1560,8 @@ class HDF5Dataset(HDF5BaseObject):
         if len(self.axes) < len(self.map.axis_maps):
             self.axes.extend([{} for i in range(len(self.map.axis_maps) - len(self.axes))])
 
+        full_name = self._full_name
+        shape = self.shape if self.exists else None
         temp_kwargs = {"require": True, "file": self.file}
         new_kwargs_len = len(axes_kwargs)
         old_kwargs_len = len(self.axes_kwargs)
@@ -1060,10 +1569,10 @@ class HDF5Dataset(HDF5BaseObject):
             for name, axis_map in dim.items():
                 new_kwargs = axes_kwargs[i].get(name, {}) if i < new_kwargs_len else {}
                 old_kwargs = self.axes_kwargs[i].get(name, {}) if i < old_kwargs_len else {}
-                temp_kwargs["name"] = f"{self._full_name}_{name}"
+                temp_kwargs["name"] = f"{full_name}_{name}"
                 temp_kwargs["scale_name"] = name
-                if "data" not in new_kwargs and "data" not in old_kwargs and self.exists:
-                    temp_kwargs["component_kwargs"] = {"axis": {"size": self.shape[i]}}
+                if shape is not None and "data" not in new_kwargs and "data" not in old_kwargs:
+                    temp_kwargs["component_kwargs"] = {"axis": {"size": shape[i]}}
                 kwargs = temp_kwargs | old_kwargs | new_kwargs
                 self.axes[i][name] = axis = axis_map.get_object(**kwargs)
                 self._dataset.dims[i].attach_scale(axis._dataset)
@@ -1107,9 +1616,64 @@ class HDF5Dataset(HDF5BaseObject):
             # Assign Data
             if data.shape != self._dataset.shape:
                 self._dataset.resize(data.shape)  # resize for new data
-            self._dataset[...] = data
+            self.write_data(data)
             self.clear_all_caches()
 
+    def write_data(self, data: np.ndarray, selection: tuple[slice, ...] | None = None) -> None:
+        """Writes data directly from a contiguous array into a selection of the dataset.
+
+        When the whole of a chunked dataset is written from data which must be converted to a contiguous array of the
+        dataset's dtype, the data is converted and written one chunk at a time, so a full converted copy is never made.
+
+        Args:
+            data: The data to write, which must have the shape of the selection.
+            selection: The slices of the dataset to write to, the whole dataset when not given.
+        """
+        with self:
+            dataset = self._dataset
+            dtype = dataset.dtype
+            if dtype.hasobject:  # Variable length types are converted by h5py while writing.
+                dataset[... if selection is None else selection] = data
+            elif not data.size:
+                return
+            elif (
+                selection is None
+                and dataset.chunks is not None
+                and not (data.dtype == dtype and data.flags.c_contiguous)
+            ):
+                for chunk in dataset.iter_chunks():
+                    dataset.write_direct(np.ascontiguousarray(data[chunk], dtype=dtype), dest_sel=chunk)
+            elif selection is None:
+                dataset.write_direct(np.ascontiguousarray(data, dtype=dtype))
+            else:
+                data = np.ascontiguousarray(data, dtype=dtype)
+                ranges = [s.indices(n) if isinstance(s, slice) else None for s, n in zip(selection, dataset.shape)]
+                counts = tuple(stop - start for start, stop, _ in ranges) if ranges and None not in ranges else None
+                if counts == data.shape and all(step == 1 for *_, step in ranges):
+                    self.write_block(data, tuple(start for start, *_ in ranges))
+                else:
+                    dataset.write_direct(data, dest_sel=selection)
+
+    def write_block(self, data: np.ndarray, start: tuple[int, ...]) -> None:
+        """Writes data into the block of the dataset which starts at an index and has the shape of the data.
+
+        The block is selected directly on the dataspace, skipping h5py's generic selection handling.
+
+        Args:
+            data: The data to write.
+            start: The index of the first item of the block in the dataset.
+        """
+        with self:
+            dataset = self._dataset
+            dtype = dataset.dtype
+            if dtype.hasobject:  # Variable length types are converted by h5py while writing.
+                dataset[tuple(slice(i, i + n) for i, n in zip(start, data.shape))] = data
+            elif data.size:
+                data = np.ascontiguousarray(data, dtype=dtype)
+                file_space = dataset.id.get_space()
+                file_space.select_hyperslab(start, data.shape)
+                dataset.id.write(h5py.h5s.create_simple(data.shape), file_space, data, dxpl=dataset._dxpl)
+
     def set_data_components(self, **component_kwargs: dict[str, Any]) -> None:
         """Sets the data of the components of this dataset.
 
@@ -1158,7 +1722,7 @@ class HDF5Dataset(HDF5BaseObject):
                 self._dataset.refresh()
 
             # Get the shapes of the dataset and the new data to be added
-            s_shape = np.asarray(self._dataset.shape)
+            s_shape = self._dataset.shape
             d_shape = list(data.shape)
             s_ndim = len(s_shape)
             d_ndim = len(d_shape)
@@ -1167,25 +1731,63 @@ class HDF5Dataset(HDF5BaseObject):
             elif d_ndim == s_ndim - 1:
                 d_extension = 1
                 d_shape.insert(axis, 1)
-                d_ndim = len(d_shape)
             else:
                 raise ValueError("Cannot append with two different numbers of dimensions.")
 
             # Determine the new shape of the dataset
-            maxs = np.zeros((2, len(d_shape)))
-            maxs[0, :s_ndim] = s_shape
-            maxs[1, :d_ndim] = d_shape
-            new_shape = maxs.max(0)
-            new_shape[axis] = s_extension = s_shape[axis] + d_extension
+            new_shape = [max(s, d) for s, d in zip(s_shape, d_shape)]
+            new_shape[axis] = s_shape[axis] + d_extension
             # Determine the location where the new data should be assigned
-            slicing = [slice(s) for s in d_shape]
-            slicing[axis] = slice(s_shape[axis], s_extension)
+            start = [0] * s_ndim
+            start[axis] = s_shape[axis]
 
             # Assign Data
             self._dataset.resize(new_shape)  # resize for new data
-            self._dataset[tuple(slicing)] = data  # Assign data to the new location
+            self.write_block(np.reshape(data, d_shape), tuple(start))  # Assign data to the new location
             self.clear_all_caches()
 
+    def append_data_buffered(self, data: np.ndarray, axis: int = 0, flush: bool = False) -> None:
+        """Buffers data to append to the dataset, appending the buffer once it fills a chunk along the axis.
+
+        Appending a chunk at a time resizes the dataset and writes to each chunk once, rather than once per append.
+        The buffered data is not in the dataset until it is flushed, which also happens when this dataset closes the
+        file, when the file is flushed or closed, and when this object is pickled.
+
+        Args:
+            data: The data to append.
+            axis: The axis to append the data along.
+            flush: Determines if the buffer will be appended to the dataset after adding the data.
+        """
+        if self._append_buffer and axis != self._append_buffer_axis:
+            self.flush_append_buffer()
+
+        with self:
+            dataset = self._dataset
+            if data.ndim == dataset.ndim - 1:
+                data = np.expand_dims(data, axis)
+            chunks = dataset.chunks
+            chunk_length = 1 if chunks is None else chunks[axis]
+
+        if not self._append_buffer:
+            self.file.register_append_buffer(self)
+        self._append_buffer.append(data)
+        self._append_buffer_axis = axis
+        self._append_buffer_length += data.shape[axis]
+        if flush or self._append_buffer_length >= chunk_length:
+            self.flush_append_buffer()
+
+    def flush_append_buffer(self) -> None:
+        """Appends all the buffered data to the dataset in one write, keeping the data buffered if the write fails."""
+        if not self._append_buffer:
+            return
+
+        buffer = self._append_buffer
+        data = buffer[0] if len(buffer) == 1 else np.concatenate(buffer, axis=self._append_buffer_axis)
+        self.append_data(data, axis=self._append_buffer_axis)
+        self._append_buffer = []
+        self._append_buffer_length = 0
+        self.file.unregister_append_buffer(self)
+
     def append_data_item_dict(self, dict_: dict, axis: int = 0) -> None:
         """Appends a dictionary which would represent a single item to the dataset.
 
@@ -1193,7 +1795,17 @@ class HDF5Dataset(HDF5BaseObject):
             dict_: The dictionary to add as an item to the dataset.
             axis: The axis to add the dictionary along.
         """
-        self.append_data(np.array(self.dict_to_item(dict_), dtype=self.dtype), axis=axis)
+        with self:
+            dataset = self._dataset
+            if axis == 0 and dataset.ndim == 1:  # A single row can be written as a tuple without making an array.
+                if self.file.swmr_mode:
+                    dataset.refresh()
+                index = dataset.shape[0]
+                dataset.resize((index + 1,))
+                dataset[index] = self.dict_to_item(dict_)
+                self.clear_all_caches()
+            else:
+                self.append_data(np.array(self.dict_to_item(dict_), dtype=self.dtype), axis=axis)
 
     def append_components(self, **component_kwargs: dict[str, Any]) -> None:
         """Appends data to the components of this dataset.
@@ -1223,7 +1835,8 @@ class HDF5Dataset(HDF5BaseObject):
             dict_: The dictionary to add as an item to the dataset.
             axis: The axis to add the dictionary along.
         """
-        self.append(np.array(self.dict_to_item(dict_), dtype=self.dtype), axis=axis)
+        self.append_data_item_dict(dict_, axis=axis)
+        self.append_components()
 
     def extend_data_item_dicts(self, iter_: Iterable[dict], axis: int = 0) -> None:
         """Extends the dataset with an iterable of dictionaries which would represent single items.
@@ -1232,7 +1845,12 @@ class HDF5Dataset(HDF5BaseObject):
             iter_: An iterable of dictionaries to append to the dataset.
             axis: The axis to extend the dictionaries to.
         """
-        self.append_data(np.fromiter((self.dict_to_item(item) for item in iter_), dtype=list(self._dtype)), axis=axis)
+        items = list(iter_)
+        data = np.empty(len(items), dtype=self.dtype)
+        cast_from_iter = self.caster.cast_from_iter
+        for name, _ in self.dtypes:  # Fill by field, so each field is cast in one batch instead of per item.
+            data[name] = cast_from_iter(item[name] for item in items)
+        self.append_data(data, axis=axis)
 
     def insert_data(self, index: int | slice | Iterable[int], data: np.ndarray, axis: int = 0) -> None:
         """Insert data to the dataset along a specified axis.
@@ -1409,6 +2027,7 @@ class HDF5Dataset(HDF5BaseObject):
             axis: The axis to detach the axis (scale) from.
         """
         del self.axes[axis][dataset.scale_name]
+        self._axes_loaded = False
 
         with self:
             self._dataset.dims[axis].detach_scale(dataset._dataset)
@@ -56,6 +56,7 @@ class HDF5File(HDF5BaseObject):
         _name_: The name of the first layer in the file.
         allow_swmr_create: Determines if creating a dataset during swmr is allowed, forces close open if allowed.
         _group: The first layer group this object will wrap.
+        _append_buffers: The datasets of this file which have buffered data that has not been appended yet.
 
     Args:
         file: Either the file object or the path to the file.
@@ -187,6 +188,7 @@ class HDF5File(HDF5BaseObject):
         self.allow_swmr_create: bool = False
 
         self._group: HDF5Group | None = None
+        self._append_buffers: dict[int, HDF5Dataset] = {}
 
         # Parent Attributes #
         super().__init__(init=False)
@@ -217,10 +219,7 @@ class HDF5File(HDF5BaseObject):
 
     @path.setter
     def path(self, value: str | pathlib.Path) -> None:
-        if isinstance(value, pathlib.Path) or value is None:
-            self._path = value
-        else:
-            self._path = pathlib.Path(value)
+        self._path = None if value is None else pathlib.Path(value)
 
     @property
     def is_open(self) -> bool:
@@ -263,7 +262,7 @@ class HDF5File(HDF5BaseObject):
         """
         state = super().__getstate__()
         state["is_open"] = self.is_open
-        del state["__file"], state["_group"]
+        del state["__file"], state["_group"], state["_append_buffers"]
         return state
 
     def __setstate__(self, state: Mapping[str, Any]) -> None:
@@ -273,6 +272,7 @@ class HDF5File(HDF5BaseObject):
             state: The attributes to build this object from.
         """
         was_open = state.pop("is_open")
+        self._append_buffers = {}
         super().__setstate__(state=state)
         self.construct(open_=was_open)
 
@@ -684,15 +684,51 @@ class HDF5File(HDF5BaseObject):
             if not was_open:
                 self.close()
 
+    def register_append_buffer(self, dataset: HDF5Dataset) -> None:
+        """Registers a dataset which has buffered data, so the data is appended before this file is closed.
+
+        Args:
+            dataset: The dataset with buffered data.
+        """
+        self._append_buffers[id(dataset)] = dataset
+
+    def unregister_append_buffer(self, dataset: HDF5Dataset) -> None:
+        """Removes a dataset which has no more buffered data.
+
+        Args:
+            dataset: The dataset which flushed its buffered data.
+        """
+        self._append_buffers.pop(id(dataset), None)
+
+    def flush_append_buffers(self) -> None:
+        """Appends the buffered data of every dataset of this file, raising the first error after trying them all."""
+        error = None
+        for dataset in list(self._append_buffers.values()):
+            try:
+                dataset.flush_append_buffer()
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
+    def flush(self) -> None:
+        """Appends all buffered data and flushes the HDF5 file."""
+        self.flush_append_buffers()
+        self._file.flush()
+
     def close(self) -> bool:
-        """Closes the HDF5 file.
+        """Closes the HDF5 file, appending all buffered data first.
 
         Returns:
             If the file was successfully closed.
         """
         if self.is_open:
-            self._file.flush()
-            self._file.close()
+            try:
+                self.flush_append_buffers()
+                self._file.flush()
+            finally:  # The file is closed even if buffered data cannot be written, which stays buffered.
+                self._file.close()
         return not self.is_open
 
     # Caching
@@ -206,11 +206,13 @@ class HDF5Group(HDF5BaseObject):
             self.set_parent(parent=parent)
         elif map_ is not None:
             self._parents = self.map.parents
+            self._full_name_cache = None
 
         if name is not None:
             self.set_name(name=name)
         elif map_ is not None:
             self._name_ = self.map.name
+            self._full_name_cache = None
 
         if mode is not None:
             self.set_mode(mode)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_hdf5caster.py
+Description:
+"""
+# Package Header #
+from src.hdf5objects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import datetime
+import uuid
+import zoneinfo
+
+# Third-Party Packages #
+from dspobjects.time import Timestamp
+import pytest
+
+# Local Packages #
+from src.hdf5objects.hdf5bases import HDF5Caster
+
+
+# Definitions #
+# Functions #
+@pytest.fixture
+def mixed_items():
+    """A pytest fixture that makes items of registered types, subclasses of them, and unregistered types."""
+    return [
+        datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        Timestamp(2020, 1, 2, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2020, 1, 3, tzinfo=datetime.timezone.utc),
+        3,
+        datetime.timedelta(seconds=2),
+        uuid.UUID(int=5),
+        zoneinfo.ZoneInfo("UTC"),
+        "x",
+        object,
+    ]
+
+
+# Classes #
+class TestHDF5Caster:
+    def test_cast_from_iter_matches_cast_from(self, mixed_items):
+        assert HDF5Caster.cast_from_iter(mixed_items) == [HDF5Caster.cast_from(item) for item in mixed_items]
+
+    def test_cast_from_iter_unregistered_first(self, mixed_items):
+        items = mixed_items[::-1]
+        assert HDF5Caster.cast_from_iter(iter(items)) == [HDF5Caster.cast_from(item) for item in items]
+
+    def test_cast_from_iter_homogeneous(self):
+        items = [datetime.timedelta(seconds=s) for s in range(5)]
+        assert HDF5Caster.cast_from_iter(item for item in items) == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_cast_from_iter_empty(self):
+        assert HDF5Caster.cast_from_iter([]) == []
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
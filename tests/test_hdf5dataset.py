@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_hdf5dataset.py
+Description:
+"""
+# Package Header #
+from src.hdf5objects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import gc
+
+# Third-Party Packages #
+import h5py
+import pytest
+import numpy as np
+
+# Local Packages #
+from src.hdf5objects import HDF5File, HDF5Dataset, DatasetMap
+
+
+# Definitions #
+# Functions #
+@pytest.fixture
+def chunked_file(tmp_path):
+    """A pytest fixture that makes a file with a resizable chunked dataset."""
+    path = tmp_path / "test.h5"
+    with h5py.File(path, "w") as file:
+        file.create_dataset("data", data=np.zeros((8, 2)), chunks=(64, 2), maxshape=(None, 2))
+    return path
+
+
+@pytest.fixture
+def contiguous_file(tmp_path):
+    """A pytest fixture that makes a file with a contiguous dataset."""
+    path = tmp_path / "contiguous.h5"
+    with h5py.File(path, "w") as file:
+        file.create_dataset("data", data=np.arange(12.0).reshape(3, 4))
+    return path
+
+
+@pytest.fixture
+def compressed_data():
+    """A pytest fixture that makes data which spans partial chunks on both axes."""
+    return np.random.default_rng(0).normal(size=(1000, 3))
+
+
+# Classes #
+class TestHDF5Dataset:
+    def test_append_data_buffered_file_close(self, chunked_file):
+        file = HDF5File(chunked_file, mode="a")
+        dataset = HDF5Dataset(name="/data", file=file)
+        dataset.append_data_buffered(np.ones(2))
+        file.close()
+
+        with h5py.File(chunked_file, "r") as file:
+            assert file["data"].shape == (9, 2)
+            assert (file["data"][8] == 1).all()
+
+    def test_append_data_buffered_file_flush(self, chunked_file):
+        file = HDF5File(chunked_file, mode="a")
+        dataset = HDF5Dataset(name="/data", file=file)
+        dataset.append_data_buffered(np.ones((3, 2)))
+        assert dataset.shape == (8, 2)
+        file.flush()
+        assert dataset.shape == (11, 2)
+        file.close()
+
+    def test_append_data_buffered_delete(self, chunked_file):
+        file = HDF5File(chunked_file, mode="a")
+        dataset = HDF5Dataset(name="/data", file=file)
+        dataset.append_data_buffered(np.ones(2))
+        del dataset
+        gc.collect()
+        file.close()
+
+        with h5py.File(chunked_file, "r") as file:
+            assert file["data"].shape == (9, 2)
+
+    def test_append_data_buffered_read_only(self, chunked_file):
+        file = HDF5File(chunked_file, mode="r")
+        dataset = HDF5Dataset(name="/data", file=file)
+        dataset.append_data_buffered(np.ones(2))
+        with pytest.raises(Exception):
+            file.close()
+        assert not file.is_open
+
+        file.open(mode="a")
+        dataset.flush_append_buffer()
+        file.close()
+
+        with h5py.File(chunked_file, "r") as file:
+            assert file["data"].shape == (9, 2)
+
+    def test_append_data_buffered_failed_flush(self, chunked_file):
+        file = HDF5File(chunked_file, mode="a")
+        dataset = HDF5Dataset(name="/data", file=file)
+        dataset.append_data_buffered(np.ones(3))
+        with pytest.raises(Exception):
+            file.flush()
+        with pytest.raises(Exception):  # The rows are still buffered, so closing tries to write them again.
+            file.close()
+        assert not file.is_open
+
+    def test_get_all_data_copy(self, contiguous_file):
+        file = HDF5File(contiguous_file, mode="r")
+        dataset = HDF5Dataset(name="/data", file=file)
+        data = dataset.get_all_data()
+        array = np.array(dataset)
+        file.close()
+
+        assert not isinstance(data, np.memmap) and data.flags.writeable
+        data += 1
+        assert data.sum() == np.arange(1.0, 13.0).sum()
+        assert array.flags.writeable
+
+    def test_asarray_copy(self, contiguous_file):
+        file = HDF5File(contiguous_file, mode="r")
+        dataset = HDF5Dataset(name="/data", file=file)
+        array = np.asarray(dataset)
+        file.close()
+
+        assert array.flags.writeable and array.flags.owndata
+        assert (array == np.arange(12.0).reshape(3, 4)).all()
+
+    def test_contains_rows(self, contiguous_file):
+        file = HDF5File(contiguous_file, mode="r")
+        dataset = HDF5Dataset(name="/data", file=file)
+
+        assert [4.0, 5.0, 6.0, 7.0] in dataset
+        assert [0.0, 5.0, 10.0, 3.0] not in dataset  # Each value is in some row, but no row matches.
+        assert [0.0, 1.0] not in dataset
+        file.close()
+
+    def test_update_attributes_before_create(self, contiguous_file):
+        map_ = DatasetMap(name="/new", attributes={"unit": "V"})
+        file = HDF5File(contiguous_file, mode="a")
+        dataset = HDF5Dataset(name="/new", map_=map_, file=file)
+        dataset.attributes.update(unit="mV", gain=2)
+        assert dataset.attributes.get("unit") == "mV"
+        dataset.require(data=np.zeros(3))
+        file.close()
+
+        assert map_.attributes["unit"] == "V" and "gain" not in map_.attributes
+        with h5py.File(contiguous_file, "r") as file:
+            assert file["new"].attrs["unit"] == "mV"
+            assert file["new"].attrs["gain"] == 2
+
+    def test_file_closed_while_open(self, contiguous_file):
+        file = HDF5File(contiguous_file, mode="a")
+        dataset = HDF5Dataset(name="/data", file=file)
+        dataset.open()
+        dataset.file.close()
+        assert dataset.dtype == np.float64
+        assert dataset[1, 0] == 4.0
+        dataset[1, 0] = 0.5
+        dataset.close()
+
+        with dataset:
+            file.close()
+            assert dataset[1, 0] == 0.5
+        file.close()
+
+    def test_auto_chunks_small(self, contiguous_file):
+        file = HDF5File(contiguous_file, mode="a")
+        HDF5Dataset(name="/small", file=file, data=np.arange(10.0), maxshape=(None,), require=True)
+        file.close()
+
+        with h5py.File(contiguous_file, "r") as file:
+            assert file["small"].chunks[0] * 8 < 1 << 20
+
+    def test_auto_chunks_large(self, contiguous_file):
+        file = HDF5File(contiguous_file, mode="a")
+        HDF5Dataset(name="/large", file=file, data=np.zeros((40000, 4)), maxshape=(None, 4), require=True)
+        file.close()
+
+        with h5py.File(contiguous_file, "r") as file:
+            assert file["large"].chunks == (32768, 4)
+
+    def test_get_auto_chunks_clamped(self):
+        assert HDF5Dataset.get_auto_chunks((10,), (None,), np.dtype(np.float64)) == (64,)
+        assert HDF5Dataset.get_auto_chunks((1000, 3), (None, 3), np.dtype(np.float64)) == (1000, 3)
+
+    def test_update_attributes_without_exists(self, contiguous_file, monkeypatch):
+        file = HDF5File(contiguous_file, mode="a")
+        dataset = HDF5Dataset(name="/data", file=file)
+        attributes = dataset.attributes
+        file.close()
+        monkeypatch.setattr(type(attributes), "is_exist", lambda self: pytest.fail("update checked if it exists"))
+        attributes.update(unit="mV")
+        assert not file.is_open
+
+        with h5py.File(contiguous_file, "r") as file:
+            assert file["data"].attrs["unit"] == "mV"
+
+    @pytest.mark.parametrize("axis, block_size", [(0, None), (0, 2), (1, 3), (1, 10)])
+    def test_iter_blocks(self, contiguous_file, axis, block_size):
+        file = HDF5File(contiguous_file, mode="r")
+        dataset = HDF5Dataset(name="/data", file=file)
+        blocks = [(start, block.copy()) for start, block in dataset.iter_blocks(axis=axis, block_size=block_size)]
+        file.close()
+
+        expected = np.arange(12.0).reshape(3, 4)
+        length = expected.shape[axis]
+        step = length if block_size is None else min(block_size, length)  # Contiguous data reads the whole axis.
+        assert [start for start, _ in blocks] == list(range(0, length, step))
+        assert np.array_equal(np.concatenate([block for _, block in blocks], axis=axis), expected)
+
+    def test_read_all_data_parallel_deflate(self, tmp_path, compressed_data):
+        path = tmp_path / "deflate.h5"
+        with h5py.File(path, "w") as file:
+            file.create_dataset("data", data=compressed_data, chunks=(128, 2), compression="gzip")
+            expected = file["data"][...]
+
+        file = HDF5File(path, mode="r")
+        dataset = HDF5Dataset(name="/data", file=file)
+        data = dataset.read_all_data_parallel(n_workers=4)
+        file.close()
+
+        assert np.array_equal(data, expected)
+
+    @pytest.mark.parametrize("compression", ["none", "lz4", "zstd"])
+    def test_read_all_data_parallel_bitshuffle(self, tmp_path, compressed_data, compression):
+        bitshuffle_h5 = pytest.importorskip("bitshuffle.h5")
+        options = {
+            "none": 0,
+            "lz4": bitshuffle_h5.H5_COMPRESS_LZ4,
+            "zstd": getattr(bitshuffle_h5, "H5_COMPRESS_ZSTD", None),
+        }[compression]
+        if options is None:
+            pytest.skip("bitshuffle was built without zstd")
+
+        path = tmp_path / "bitshuffle.h5"
+        with h5py.File(path, "w") as file:
+            file.create_dataset(
+                "data",
+                data=compressed_data,
+                chunks=(128, 2),
+                compression=bitshuffle_h5.H5FILTER,
+                compression_opts=(0, options),
+            )
+            expected = file["data"][...]
+
+        file = HDF5File(path, mode="r")
+        dataset = HDF5Dataset(name="/data", file=file)
+        data = dataset.read_all_data_parallel(n_workers=4)
+        file.close()
+
+        assert np.array_equal(data, expected)
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
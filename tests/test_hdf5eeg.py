@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_hdf5eeg.py
+Description:
+"""
+# Package Header #
+from src.hdf5objects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import datetime
+
+# Third-Party Packages #
+import h5py
+import pytest
+import numpy as np
+
+# Local Packages #
+from src.hdf5objects.fileobjects import HDF5EEG
+
+
+# Definitions #
+# Functions #
+def make_eeg_file(path, start, n_samples=10):
+    """Makes an EEG file with one sample per second from the start in seconds."""
+    with h5py.File(path, "w") as file:
+        data = file.create_dataset("EEG Array", data=np.zeros((n_samples, 2)), maxshape=(None, 2))
+        nanostamps = (np.arange(n_samples, dtype=np.uint64) + np.uint64(start)) * np.uint64(10**9)
+        time_axis = file.create_dataset("EEG Array_time_axis", data=nanostamps, maxshape=(None,))
+        time_axis.make_scale("time_axis")
+        data.dims[0].attach_scale(time_axis)
+        file.attrs["FileType"] = "EEG"
+        file.attrs["FileVersion"] = "0.0.0"
+    return path
+
+
+@pytest.fixture
+def eeg_files(tmp_path):
+    """A pytest fixture that makes two EEG files with data and one without data."""
+    first = HDF5EEG(make_eeg_file(tmp_path / "first.h5", 100), mode="r", load=True)
+    second = HDF5EEG(make_eeg_file(tmp_path / "second.h5", 200), mode="r", load=True)
+    empty = HDF5EEG(make_eeg_file(tmp_path / "empty.h5", 0, n_samples=0), mode="r", load=True)
+    yield first, second, empty
+    for file in (first, second, empty):
+        file.close()
+
+
+# Classes #
+class TestHDF5EEG:
+    @pytest.mark.parametrize("start", [1577836800, 1577836800.5, np.uint64(1577836800 * 10**9)])
+    def test_generate_file_name(self, start):
+        assert HDF5EEG.generate_file_name("S1", start) == "S1_2020-01-01_00~00~00.h5"
+
+    def test_generate_file_name_datetime(self):
+        utc = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        shifted = utc.astimezone(datetime.timezone(datetime.timedelta(hours=-5)))
+        name = HDF5EEG.generate_file_name("S1", utc.timestamp())
+        assert HDF5EEG.generate_file_name("S1", utc) == name
+        assert HDF5EEG.generate_file_name("S1", shifted) == name
+
+    def test_generate_file_name_naive(self):
+        naive = datetime.datetime(2020, 1, 1)
+        assert HDF5EEG.generate_file_name("S1", naive) == HDF5EEG.generate_file_name("S1", naive.timestamp())
+
+    def test_find_time_indices(self, eeg_files):
+        first, _, _ = eeg_files
+        indices = first.find_time_indices([100.0, 103.0, 103.5, 109.0])
+        assert list(indices) == [0, 3, 3, 9]
+
+    def test_ordering(self, eeg_files):
+        first, second, empty = eeg_files
+        assert first < second and second > first
+        assert first < empty and not empty < first
+        assert sorted([empty, second, first]) == [first, second, empty]
+
+    def test_compare_times(self, eeg_files):
+        first, _, _ = eeg_files
+        assert first == 100
+        assert first < 150.0
+
+    def test_compare_non_times(self, eeg_files):
+        first, _, _ = eeg_files
+        assert first != None  # noqa: E711
+        assert first != "first"
+        with pytest.raises(TypeError):
+            first < "first"
+
+    def test_refresh_start(self, tmp_path):
+        file = HDF5EEG(make_eeg_file(tmp_path / "refresh.h5", 100), mode="a", load=True)
+        assert file.start_nanostamp == 100 * 10**9
+        file.attributes["start"] = np.uint64(5 * 10**9)
+        file.refresh()
+        start = file.start_nanostamp
+        file.close()
+
+        assert start == 5 * 10**9
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
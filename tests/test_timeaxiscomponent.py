@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_timeaxiscomponent.py
+Description:
+"""
+# Package Header #
+from src.hdf5objects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import datetime
+
+# Third-Party Packages #
+from dspobjects.time import nanostamp
+import h5py
+import pytest
+import numpy as np
+
+# Local Packages #
+from src.hdf5objects.fileobjects import HDF5EEG
+from src.hdf5objects.dataset.axes.timeaxiscomponent import to_nanostamps
+
+
+# Definitions #
+# Functions #
+@pytest.fixture
+def nanostamp_file(tmp_path):
+    """A pytest fixture that makes an EEG file with a uint64 nanostamp time axis."""
+    path = tmp_path / "nanostamps.h5"
+    with h5py.File(path, "w") as file:
+        data = file.create_dataset("EEG Array", data=np.zeros((10, 2)), maxshape=(None, 2))
+        nanostamps = (np.arange(10, dtype=np.uint64) + np.uint64(10**9)) * np.uint64(10**9)
+        time_axis = file.create_dataset("EEG Array_time_axis", data=nanostamps, maxshape=(None,))
+        time_axis.make_scale("time_axis")
+        data.dims[0].attach_scale(time_axis)
+        file.attrs["FileType"] = "EEG"
+        file.attrs["FileVersion"] = "0.0.0"
+    return path
+
+
+# Classes #
+class TestToNanostamps:
+    @pytest.mark.parametrize("value", [5, 5.0, np.uint64(5 * 10**9), np.array([5]), np.array([5.0])])
+    def test_units_match_nanostamp(self, value):
+        assert int(np.ravel(to_nanostamps(value))[0]) == int(np.ravel(nanostamp(value))[0])
+
+    def test_datetime(self):
+        value = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        assert to_nanostamps(value) == int(value.timestamp()) * 10**9
+
+    def test_timedelta(self):
+        assert to_nanostamps(datetime.timedelta(seconds=-3)) == -3 * 10**9
+
+
+class TestTimeAxisComponent:
+    @pytest.mark.parametrize("seconds", [2, -3])
+    def test_shift_timedelta_nanostamps(self, nanostamp_file, seconds):
+        file = HDF5EEG(nanostamp_file, mode="a", load=True)
+        file.time_axis.components["axis"].shift(datetime.timedelta(seconds=seconds))
+        first = int(file.time_axis[0])
+        file.close()
+
+        assert first == (10**9 + seconds) * 10**9
+
+    def test_datetimes_refresh(self, nanostamp_file):
+        file = HDF5EEG(nanostamp_file, mode="a", load=True)
+        axis = file.time_axis.components["axis"]
+        first = axis.datetimes[0]
+        axis.refresh()
+        axis.mask_time_zone(datetime.timezone(datetime.timedelta(hours=2)))
+        masked = axis.datetimes[0]
+        file.close()
+
+        assert first.timestamp() == masked.timestamp() == 10**9
+        assert masked.utcoffset() == datetime.timedelta(hours=2)
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
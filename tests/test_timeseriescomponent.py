@@ -25,6 +25,7 @@ from typing import Any
 # Third-Party Packages #
 from classversioning import Version, TriNumberVersion
 from hdf5objects import HDF5Map
+import h5py
 import pytest
 import numpy as np
 
@@ -32,6 +33,7 @@ import numpy as np
 from src.hdf5objects import BaseHDF5, BaseHDF5Map, HDF5Dataset, DatasetMap
 from src.hdf5objects.dataset import TimeAxisMap
 from src.hdf5objects.dataset.components import TimeSeriesComponent
+from src.hdf5objects.fileobjects import HDF5EEG
 
 
 # Definitions #
@@ -134,6 +136,57 @@ class TestDataset(ClassTest):
     #     assert tuple(test_data) == tuple(new_dict)
 
 
+class TestTimeSeriesComponent:
+    @pytest.fixture
+    def eeg_file(self, tmp_path):
+        """Makes an EEG file with chunked data and one sample per second starting at 100 seconds."""
+        path = tmp_path / "eeg.h5"
+        with h5py.File(path, "w") as file:
+            data = file.create_dataset(
+                "EEG Array",
+                data=np.arange(20.0).reshape(10, 2),
+                chunks=(4, 2),
+                maxshape=(None, 2),
+            )
+            nanostamps = (np.arange(10, dtype=np.uint64) + np.uint64(100)) * np.uint64(10**9)
+            time_axis = file.create_dataset("EEG Array_time_axis", data=nanostamps, maxshape=(None,))
+            time_axis.make_scale("time_axis")
+            data.dims[0].attach_scale(time_axis)
+            file.attrs["FileType"] = "EEG"
+            file.attrs["FileVersion"] = "0.0.0"
+        file = HDF5EEG(path, mode="r", load=True)
+        yield file
+        file.close()
+
+    @pytest.mark.parametrize(
+        "start, stop, step",
+        [(None, None, None), (1, 9, None), (3, 5, None), (0, 10, 3), (6, 2, -1), (None, None, -3), (5, 5, None)],
+    )
+    def test_get_block_range(self, eeg_file, start, stop, step):
+        timeseries = eeg_file.data.components["timeseries"]
+        expected = np.arange(20.0).reshape(10, 2)[start:stop:step]
+        assert np.array_equal(timeseries.get_block_range(start, stop, step), expected)
+        assert np.array_equal(timeseries.get_block_range(start, stop, step), expected)  # Read from cached blocks.
+
+    def test_find_data_ranges(self, eeg_file):
+        timeseries = eeg_file.data.components["timeseries"]
+        data = np.arange(20.0).reshape(10, 2)
+        found = timeseries.find_data_ranges([101.0, 102.5, 50.0, 108.0, 200.0], [103.0, 105.0, 100.0, 300.0, 300.0])
+
+        assert [(f.start, f.end) for f in found] == [(1, 4), (3, 6), (0, 1), (8, 10), (None, None)]
+        for f in found[:4]:
+            assert np.array_equal(f.data, data[f.start : f.end])
+        assert found[4].data is None
+
+    def test_find_data_ranges_nanostamps(self, eeg_file):
+        timeseries = eeg_file.data.components["timeseries"]
+        starts = np.array([101, 105], dtype=np.uint64) * np.uint64(10**9)
+        stops = np.array([102, 105], dtype=np.uint64) * np.uint64(10**9)
+        found = timeseries.find_data_ranges(starts, stops)
+
+        assert [(f.start, f.end) for f in found] == [(1, 3), (5, 6)]
+
+
 # Main #
 if __name__ == "__main__":
     pytest.main(["-v", "-s"])